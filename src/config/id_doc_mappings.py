@@ -1,608 +1,595 @@
-# Auto-generated from mapping_proposal.md
-ID_DOC_MAPPINGS = {
-    1236: {
-        "name": "Afghan Money Service Provider License Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "AFGHAN_MSP"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", "AF")],
-    },
-    1264: {
-        "name": "MMSI",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "MMSI"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1412: {
-        "name": "Company Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "COMPANY_NUMBER"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1475: {
-        "name": "Public Registration Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "PUB_REG_NUM"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1478: {
-        "name": "N.I.F.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [("NATIONAL_ID_TYPE", "NIF"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1481: {
-        "name": "RTN",
-        "group": "ACCOUNT/FINANCIAL IDENTIFIERS",
-        "instructions": [("ACCOUNT_NUMBER", None), ("ACCOUNT_DOMAIN", "RTN")],
-    },
-    1482: {
-        "name": "Numero de Identidad",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "NUMERO_IDENTIDAD"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1484: {
-        "name": "SRE Permit No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "SRE_PERMIT"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1492: {
-        "name": "Tazkira National ID Card",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [("NATIONAL_ID_TYPE", "TAZKIRA"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", "AF")],
-    },
-    1504: {
-        "name": "License",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "LICENSE"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1508: {
-        "name": "Chinese Commercial Code",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "CHINESE_COMMERCIAL"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", "CN"),
-        ],
-    },
-    1570: {
-        "name": "Cedula No.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [("NATIONAL_ID_TYPE", "CEDULA"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1571: {
-        "name": "Passport",
-        "group": "SPECIFIC SENZING FEATURES (Direct Mappings)",
-        "instructions": [("PASSPORT_NUMBER", None), ("PASSPORT_COUNTRY", None)],
-    },
-    1572: {
-        "name": "SSN",
-        "group": "SPECIFIC SENZING FEATURES (Direct Mappings)",
-        "instructions": [("SSN_NUMBER", None)],
-    },
-    1573: {
-        "name": "R.F.C.",
-        "group": "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
-        "instructions": [("TAX_ID_TYPE", "RFC"), ("TAX_ID_NUMBER", None), ("TAX_ID_COUNTRY", None)],
-    },
-    1574: {
-        "name": "D.N.I.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [("NATIONAL_ID_TYPE", "DNI"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1575: {
-        "name": "NIT #",
-        "group": "ACCOUNT/FINANCIAL IDENTIFIERS",
-        "instructions": [("ACCOUNT_NUMBER", None), ("ACCOUNT_DOMAIN", "NIT")],
-    },
-    1576: {
-        "name": "US FEIN",
-        "group": "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
-        "instructions": [("TAX_ID_TYPE", "FEIN"), ("TAX_ID_NUMBER", None), ("TAX_ID_COUNTRY", "US")],
-    },
-    1577: {
-        "name": "Driver's License No.",
-        "group": "SPECIFIC SENZING FEATURES (Direct Mappings)",
-        "instructions": [("DRIVERS_LICENSE_NUMBER", None), ("DRIVERS_LICENSE_STATE", None)],
-    },
-    1578: {
-        "name": "RUC #",
-        "group": "ACCOUNT/FINANCIAL IDENTIFIERS",
-        "instructions": [("ACCOUNT_NUMBER", None), ("ACCOUNT_DOMAIN", "RUC")],
-    },
-    1579: {
-        "name": "N.I.E.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "NIE"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1580: {
-        "name": "C.I.F.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "CIF"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1581: {
-        "name": "Business Registration Document #",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [("NATIONAL_ID_TYPE", "BUS_REG"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1582: {
-        "name": "RIF #",
-        "group": "ACCOUNT/FINANCIAL IDENTIFIERS",
-        "instructions": [("ACCOUNT_NUMBER", None), ("ACCOUNT_DOMAIN", "RIF")],
-    },
-    1584: {
-        "name": "National ID No.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "NATIONAL_ID"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1585: {
-        "name": "Registration ID",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [("NATIONAL_ID_TYPE", "REG_ID"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1586: {
-        "name": "LE Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "LE"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1587: {
-        "name": "Bosnian Personal ID No.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "PERSONAL_ID"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", "BA"),
-        ],
-    },
-    1588: {
-        "name": "Registered Charity No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "CHARITY"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1589: {
-        "name": "V.A.T. Number",
-        "group": "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
-        "instructions": [("TAX_ID_TYPE", "VAT"), ("TAX_ID_NUMBER", None), ("TAX_ID_COUNTRY", None)],
-    },
-    1590: {
-        "name": "Credencial electoral",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "ELECTORAL"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1591: {
-        "name": "Kenyan ID No.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "NATIONAL_ID"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", "KE"),
-        ],
-    },
-    1592: {
-        "name": "Italian Fiscal Code",
-        "group": "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
-        "instructions": [("TAX_ID_TYPE", "FISCAL_CODE"), ("TAX_ID_NUMBER", None), ("TAX_ID_COUNTRY", "IT")],
-    },
-    1593: {
-        "name": "Serial No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "SERIAL"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1594: {
-        "name": "C.I.N.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "CIN"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1595: {
-        "name": "C.U.I.T.",
-        "group": "ACCOUNT/FINANCIAL IDENTIFIERS",
-        "instructions": [("ACCOUNT_NUMBER", None), ("ACCOUNT_DOMAIN", "CUIT")],
-    },
-    1596: {
-        "name": "Tax ID No.",
-        "group": "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
-        "instructions": [("TAX_ID_TYPE", "TIN"), ("TAX_ID_NUMBER", None), ("TAX_ID_COUNTRY", None)],
-    },
-    1597: {
-        "name": "Moroccan Personal ID No.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "PERSONAL_ID"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", "MA"),
-        ],
-    },
-    1598: {
-        "name": "Public Security and Immigration No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "PSI"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1600: {
-        "name": "C.U.R.P.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [("NATIONAL_ID_TYPE", "CURP"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", "MX")],
-    },
-    1601: {
-        "name": "British National Overseas Passport",
-        "group": "SPECIFIC SENZING FEATURES (Direct Mappings)",
-        "instructions": [("PASSPORT_NUMBER", None), ("PASSPORT_COUNTRY", "UK")],
-    },
-    1602: {
-        "name": "C.R. No.",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [("NATIONAL_ID_TYPE", "CR"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1603: {
-        "name": "UK Company Number",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "UK_COMPANY"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", "UK"),
-        ],
-    },
-    1604: {
-        "name": "Immigration No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "IMMIGRATION"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1605: {
-        "name": "Travel Document Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "TRAVEL_DOC"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1607: {
-        "name": "Electoral Registry No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "ELECTORAL_REG"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1608: {
-        "name": "Identification Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "IDENTIFICATION"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1609: {
-        "name": "Paraguayan tax identification number",
-        "group": "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
-        "instructions": [("TAX_ID_TYPE", "TAX_ID"), ("TAX_ID_NUMBER", None), ("TAX_ID_COUNTRY", "PY")],
-    },
-    1611: {
-        "name": "National Foreign ID Number",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "FOREIGN_ID"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1612: {
-        "name": "RFC",
-        "group": "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
-        "instructions": [("TAX_ID_TYPE", "RFC"), ("TAX_ID_NUMBER", None), ("TAX_ID_COUNTRY", None)],
-    },
-    1613: {
-        "name": "Diplomatic Passport",
-        "group": "SPECIFIC SENZING FEATURES (Direct Mappings)",
-        "instructions": [("PASSPORT_NUMBER", None), ("PASSPORT_COUNTRY", None)],
-    },
-    1614: {
-        "name": "Dubai Chamber of Commerce Membership No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "DUBAI_CHAMBER"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", "AE")],
-    },
-    1615: {
-        "name": "Trade License No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "TRADE_LICENSE"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1619: {
-        "name": "Commercial Registry Number",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "COMMERCIAL_REG"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1620: {
-        "name": "Certificate of Incorporation Number",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "INCORPORATION"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1621: {
-        "name": "Tourism License No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "TOURISM_LICENSE"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1623: {
-        "name": "Aircraft Serial Identification",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "AIRCRAFT_SERIAL"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1624: {
-        "name": "Cartilla de Servicio Militar Nacional",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "MILITARY_SERVICE"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1625: {
-        "name": "C.U.I.P.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [("NATIONAL_ID_TYPE", "CUIP"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1626: {
-        "name": "Vessel Registration Identification",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "VESSEL_REG"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1627: {
-        "name": "Personal ID Card",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "PERSONAL_ID_CARD"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1628: {
-        "name": "Federal ID Card",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "FEDERAL_ID_CARD"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1629: {
-        "name": "Registration Certificate Number (Dubai)",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "DUBAI_REG_CERT"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", "AE")],
-    },
-    1630: {
-        "name": "VisaNumberID",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "VISA"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1631: {
-        "name": "Matricula Mercantil No",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "MATRICULA"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1632: {
-        "name": "Residency Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "RESIDENCY"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1633: {
-        "name": "Numero Unico de Identificacao Tributaria (NUIT)",
-        "group": "ACCOUNT/FINANCIAL IDENTIFIERS",
-        "instructions": [("ACCOUNT_NUMBER", None), ("ACCOUNT_DOMAIN", "NUIT")],
-    },
-    1634: {
-        "name": "CNP (Personal Numerical Code)",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [("NATIONAL_ID_TYPE", "CNP"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1635: {
-        "name": "Romanian Permanent Resident",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "ROM_PERM_RES"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", "RO")],
-    },
-    1636: {
-        "name": "Government Gazette Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "GOVT_GAZETTE"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1638: {
-        "name": "Fiscal Code",
-        "group": "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
-        "instructions": [("TAX_ID_TYPE", "FISCAL_CODE"), ("TAX_ID_NUMBER", None), ("TAX_ID_COUNTRY", None)],
-    },
-    1639: {
-        "name": "Pilot License Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "PILOT_LICENSE"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1642: {
-        "name": "Romanian C.R.",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "ROMANIAN_CR"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", "RO"),
-        ],
-    },
-    1643: {
-        "name": "Folio Mercantil No.",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [("NATIONAL_ID_TYPE", "FOLIO"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1644: {
-        "name": "Istanbul Chamber of Comm. No.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "ISTANBUL_CHAMBER"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", "TR")],
-    },
-    1645: {
-        "name": "Turkish Identification Number",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "TURKISH_ID"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", "TR"),
-        ],
-    },
-    1646: {
-        "name": "Romanian Tax Registration",
-        "group": "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
-        "instructions": [("TAX_ID_TYPE", "TAX_REG"), ("TAX_ID_NUMBER", None), ("TAX_ID_COUNTRY", "RO")],
-    },
-    1647: {
-        "name": "Stateless Person Passport",
-        "group": "SPECIFIC SENZING FEATURES (Direct Mappings)",
-        "instructions": [("PASSPORT_NUMBER", None), ("PASSPORT_COUNTRY", None)],
-    },
-    1648: {
-        "name": "Stateless Person ID Card",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "STATELESS_ID"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1649: {
-        "name": "Refugee ID Card",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "REFUGEE_ID"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1712: {
-        "name": "I.F.E.",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "IFE"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1719: {
-        "name": "Branch Unit Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "BRANCH_UNIT"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1720: {
-        "name": "Enterprise Number",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "ENTERPRISE"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1721: {
-        "name": "Organization Code",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [("NATIONAL_ID_TYPE", "ORG_CODE"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1739: {
-        "name": "Citizen's Card Number",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "CITIZEN_CARD"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1740: {
-        "name": "UAE Identification",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [("NATIONAL_ID_TYPE", "UAE_ID"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", "AE")],
-    },
-    1747: {
-        "name": "United Social Credit Code Certificate (USCCC)",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [("NATIONAL_ID_TYPE", "USCCC"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", "CN")],
-    },
-    1751: {
-        "name": "Chamber of Commerce Number",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "CHAMBER_COMMERCE"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1752: {
-        "name": "Legal Entity Number",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "LEGAL_ENTITY"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1753: {
-        "name": "Business Number",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "BUSINESS_NUMBER"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1759: {
-        "name": "Birth Certificate Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "BIRTH_CERT"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1760: {
-        "name": "Business Registration Number",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "BUS_REG_NUM"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1761: {
-        "name": "Registration Number",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [
-            ("NATIONAL_ID_TYPE", "REG_NUMBER"),
-            ("NATIONAL_ID_NUMBER", None),
-            ("NATIONAL_ID_COUNTRY", None),
-        ],
-    },
-    1812: {
-        "name": "MSB Registration Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "MSB_REG"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1835: {
-        "name": "File Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "FILE_NUMBER"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    1854: {
-        "name": "C.U.I.",
-        "group": "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
-        "instructions": [("NATIONAL_ID_TYPE", "CUI"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", None)],
-    },
-    1891: {
-        "name": "Seafarer's Identification Document",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "SEAFARER_ID"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    2001: {
-        "name": "Unified Social Credit Code (USCC)",
-        "group": "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
-        "instructions": [("NATIONAL_ID_TYPE", "USCC"), ("NATIONAL_ID_NUMBER", None), ("NATIONAL_ID_COUNTRY", "CN")],
-    },
-    2067: {
-        "name": "Central Registration System Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "CENTRAL_REG"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    2121: {
-        "name": "Economic Register Number (CBLS)",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "ECON_REG_CBLS"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    2158: {
-        "name": "Trademark number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "TRADEMARK"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    2159: {
-        "name": "Permit Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "PERMIT"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    2728: {
-        "name": "Military Registration Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "MILITARY_REG"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
-    2772: {
-        "name": "Russian State Individual Business Registration Number Pattern (OGRNIP)",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "OGRNIP"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", "RU")],
-    },
-    2790: {
-        "name": "Global Intermediary Identification Number",
-        "group": "OTHER IDENTIFIERS (Specialized/Unknown codes)",
-        "instructions": [("OTHER_ID_TYPE", "GIIN"), ("OTHER_ID_NUMBER", None), ("OTHER_ID_COUNTRY", None)],
-    },
+# IDRegDocType mappings for the OFAC Advanced transformer.
+#
+# Generated data: the name, group and instructions of each row in
+# _ID_DOC_MAPPINGS_RAW come from mapping_proposal.md. The rows have since been
+# rewritten by hand into Row / field-tag form, so edit them here.
+# Hand-maintained: Group, GROUP_NAMES, FIELD_NAMES, Row and the helpers and
+# derived tables after the row table.
+from enum import IntEnum
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+class Group(IntEnum):
+    """Identifier group of an ID document row; ``GROUP_NAMES[group]`` gives its label."""
+
+    OTHER = 0
+    NATIONAL = 1
+    TAX = 2
+    ACCOUNT = 3
+    BUSINESS = 4
+    SENZING = 5
+
+
+GROUP_NAMES = (
+    "OTHER IDENTIFIERS (Specialized/Unknown codes)",
+    "NATIONAL IDENTIFIERS (Country-issued unique per person/org)",
+    "TAX IDENTIFIERS (Classification per Spec Decision Tree)",
+    "ACCOUNT/FINANCIAL IDENTIFIERS",
+    "BUSINESS/ORGANIZATION REGISTRATIONS (National-level)",
+    "SPECIFIC SENZING FEATURES (Direct Mappings)",
+)
+
+# Senzing attribute names used in instructions.  Instructions refer to a
+# field by its tag (its position in FIELD_NAMES) rather than by name.
+FIELD_NAMES = (
+    "OTHER_ID_TYPE",
+    "OTHER_ID_NUMBER",
+    "OTHER_ID_COUNTRY",
+    "NATIONAL_ID_TYPE",
+    "NATIONAL_ID_NUMBER",
+    "NATIONAL_ID_COUNTRY",
+    "ACCOUNT_NUMBER",
+    "ACCOUNT_DOMAIN",
+    "PASSPORT_NUMBER",
+    "PASSPORT_COUNTRY",
+    "SSN_NUMBER",
+    "TAX_ID_TYPE",
+    "TAX_ID_NUMBER",
+    "TAX_ID_COUNTRY",
+    "DRIVERS_LICENSE_NUMBER",
+    "DRIVERS_LICENSE_STATE",
+)
+FIELD_TAGS = {name: tag for tag, name in enumerate(FIELD_NAMES)}
+
+_F_OTHER_ID_TYPE = FIELD_TAGS["OTHER_ID_TYPE"]
+_F_OTHER_ID_NUMBER = FIELD_TAGS["OTHER_ID_NUMBER"]
+_F_OTHER_ID_COUNTRY = FIELD_TAGS["OTHER_ID_COUNTRY"]
+_F_NATIONAL_ID_TYPE = FIELD_TAGS["NATIONAL_ID_TYPE"]
+_F_NATIONAL_ID_NUMBER = FIELD_TAGS["NATIONAL_ID_NUMBER"]
+_F_NATIONAL_ID_COUNTRY = FIELD_TAGS["NATIONAL_ID_COUNTRY"]
+_F_ACCOUNT_NUMBER = FIELD_TAGS["ACCOUNT_NUMBER"]
+_F_ACCOUNT_DOMAIN = FIELD_TAGS["ACCOUNT_DOMAIN"]
+_F_PASSPORT_NUMBER = FIELD_TAGS["PASSPORT_NUMBER"]
+_F_PASSPORT_COUNTRY = FIELD_TAGS["PASSPORT_COUNTRY"]
+_F_SSN_NUMBER = FIELD_TAGS["SSN_NUMBER"]
+_F_TAX_ID_TYPE = FIELD_TAGS["TAX_ID_TYPE"]
+_F_TAX_ID_NUMBER = FIELD_TAGS["TAX_ID_NUMBER"]
+_F_TAX_ID_COUNTRY = FIELD_TAGS["TAX_ID_COUNTRY"]
+_F_DRIVERS_LICENSE_NUMBER = FIELD_TAGS["DRIVERS_LICENSE_NUMBER"]
+_F_DRIVERS_LICENSE_STATE = FIELD_TAGS["DRIVERS_LICENSE_STATE"]
+
+
+class Row(NamedTuple):
+    """One ID document mapping; ``instructions`` are ``(field_tag, constant_or_None)`` pairs."""
+
+    name: str
+    group: Group
+    instructions: tuple
+
+
+# Positional indexes into a Row, for callers that index rather than use attributes.
+NAME_IDX, GROUP_IDX, INSTR_IDX = 0, 1, 2
+
+_ID_DOC_MAPPINGS_RAW = {
+    1236: Row(
+        "Afghan Money Service Provider License Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "AFGHAN_MSP"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, "AF")),
+    ),
+    1264: Row(
+        "MMSI", Group.OTHER, ((_F_OTHER_ID_TYPE, "MMSI"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None))
+    ),
+    1412: Row(
+        "Company Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "COMPANY_NUMBER"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1475: Row(
+        "Public Registration Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "PUB_REG_NUM"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1478: Row(
+        "N.I.F.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "NIF"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1481: Row("RTN", Group.ACCOUNT, ((_F_ACCOUNT_NUMBER, None), (_F_ACCOUNT_DOMAIN, "RTN"))),
+    1482: Row(
+        "Numero de Identidad",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "NUMERO_IDENTIDAD"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1484: Row(
+        "SRE Permit No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "SRE_PERMIT"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1492: Row(
+        "Tazkira National ID Card",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "TAZKIRA"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "AF")),
+    ),
+    1504: Row(
+        "License",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "LICENSE"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1508: Row(
+        "Chinese Commercial Code",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "CHINESE_COMMERCIAL"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "CN")),
+    ),
+    1570: Row(
+        "Cedula No.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "CEDULA"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1571: Row("Passport", Group.SENZING, ((_F_PASSPORT_NUMBER, None), (_F_PASSPORT_COUNTRY, None))),
+    1572: Row("SSN", Group.SENZING, ((_F_SSN_NUMBER, None),)),
+    1573: Row("R.F.C.", Group.TAX, ((_F_TAX_ID_TYPE, "RFC"), (_F_TAX_ID_NUMBER, None), (_F_TAX_ID_COUNTRY, None))),
+    1574: Row(
+        "D.N.I.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "DNI"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1575: Row("NIT #", Group.ACCOUNT, ((_F_ACCOUNT_NUMBER, None), (_F_ACCOUNT_DOMAIN, "NIT"))),
+    1576: Row("US FEIN", Group.TAX, ((_F_TAX_ID_TYPE, "FEIN"), (_F_TAX_ID_NUMBER, None), (_F_TAX_ID_COUNTRY, "US"))),
+    1577: Row(
+        "Driver's License No.",
+        Group.SENZING,
+        ((_F_DRIVERS_LICENSE_NUMBER, None), (_F_DRIVERS_LICENSE_STATE, None)),
+    ),
+    1578: Row("RUC #", Group.ACCOUNT, ((_F_ACCOUNT_NUMBER, None), (_F_ACCOUNT_DOMAIN, "RUC"))),
+    1579: Row(
+        "N.I.E.", Group.OTHER, ((_F_OTHER_ID_TYPE, "NIE"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None))
+    ),
+    1580: Row(
+        "C.I.F.", Group.OTHER, ((_F_OTHER_ID_TYPE, "CIF"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None))
+    ),
+    1581: Row(
+        "Business Registration Document #",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "BUS_REG"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1582: Row("RIF #", Group.ACCOUNT, ((_F_ACCOUNT_NUMBER, None), (_F_ACCOUNT_DOMAIN, "RIF"))),
+    1584: Row(
+        "National ID No.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "NATIONAL_ID"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1585: Row(
+        "Registration ID",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "REG_ID"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1586: Row(
+        "LE Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "LE"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1587: Row(
+        "Bosnian Personal ID No.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "PERSONAL_ID"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "BA")),
+    ),
+    1588: Row(
+        "Registered Charity No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "CHARITY"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1589: Row(
+        "V.A.T. Number", Group.TAX, ((_F_TAX_ID_TYPE, "VAT"), (_F_TAX_ID_NUMBER, None), (_F_TAX_ID_COUNTRY, None))
+    ),
+    1590: Row(
+        "Credencial electoral",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "ELECTORAL"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1591: Row(
+        "Kenyan ID No.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "NATIONAL_ID"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "KE")),
+    ),
+    1592: Row(
+        "Italian Fiscal Code",
+        Group.TAX,
+        ((_F_TAX_ID_TYPE, "FISCAL_CODE"), (_F_TAX_ID_NUMBER, None), (_F_TAX_ID_COUNTRY, "IT")),
+    ),
+    1593: Row(
+        "Serial No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "SERIAL"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1594: Row(
+        "C.I.N.", Group.OTHER, ((_F_OTHER_ID_TYPE, "CIN"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None))
+    ),
+    1595: Row("C.U.I.T.", Group.ACCOUNT, ((_F_ACCOUNT_NUMBER, None), (_F_ACCOUNT_DOMAIN, "CUIT"))),
+    1596: Row("Tax ID No.", Group.TAX, ((_F_TAX_ID_TYPE, "TIN"), (_F_TAX_ID_NUMBER, None), (_F_TAX_ID_COUNTRY, None))),
+    1597: Row(
+        "Moroccan Personal ID No.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "PERSONAL_ID"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "MA")),
+    ),
+    1598: Row(
+        "Public Security and Immigration No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "PSI"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1600: Row(
+        "C.U.R.P.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "CURP"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "MX")),
+    ),
+    1601: Row(
+        "British National Overseas Passport",
+        Group.SENZING,
+        ((_F_PASSPORT_NUMBER, None), (_F_PASSPORT_COUNTRY, "UK")),
+    ),
+    1602: Row(
+        "C.R. No.",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "CR"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1603: Row(
+        "UK Company Number",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "UK_COMPANY"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "UK")),
+    ),
+    1604: Row(
+        "Immigration No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "IMMIGRATION"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1605: Row(
+        "Travel Document Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "TRAVEL_DOC"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1607: Row(
+        "Electoral Registry No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "ELECTORAL_REG"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1608: Row(
+        "Identification Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "IDENTIFICATION"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1609: Row(
+        "Paraguayan tax identification number",
+        Group.TAX,
+        ((_F_TAX_ID_TYPE, "TAX_ID"), (_F_TAX_ID_NUMBER, None), (_F_TAX_ID_COUNTRY, "PY")),
+    ),
+    1611: Row(
+        "National Foreign ID Number",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "FOREIGN_ID"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1612: Row("RFC", Group.TAX, ((_F_TAX_ID_TYPE, "RFC"), (_F_TAX_ID_NUMBER, None), (_F_TAX_ID_COUNTRY, None))),
+    1613: Row("Diplomatic Passport", Group.SENZING, ((_F_PASSPORT_NUMBER, None), (_F_PASSPORT_COUNTRY, None))),
+    1614: Row(
+        "Dubai Chamber of Commerce Membership No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "DUBAI_CHAMBER"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, "AE")),
+    ),
+    1615: Row(
+        "Trade License No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "TRADE_LICENSE"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1619: Row(
+        "Commercial Registry Number",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "COMMERCIAL_REG"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1620: Row(
+        "Certificate of Incorporation Number",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "INCORPORATION"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1621: Row(
+        "Tourism License No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "TOURISM_LICENSE"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1623: Row(
+        "Aircraft Serial Identification",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "AIRCRAFT_SERIAL"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1624: Row(
+        "Cartilla de Servicio Militar Nacional",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "MILITARY_SERVICE"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1625: Row(
+        "C.U.I.P.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "CUIP"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1626: Row(
+        "Vessel Registration Identification",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "VESSEL_REG"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1627: Row(
+        "Personal ID Card",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "PERSONAL_ID_CARD"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1628: Row(
+        "Federal ID Card",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "FEDERAL_ID_CARD"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1629: Row(
+        "Registration Certificate Number (Dubai)",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "DUBAI_REG_CERT"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, "AE")),
+    ),
+    1630: Row(
+        "VisaNumberID",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "VISA"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1631: Row(
+        "Matricula Mercantil No",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "MATRICULA"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1632: Row(
+        "Residency Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "RESIDENCY"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1633: Row(
+        "Numero Unico de Identificacao Tributaria (NUIT)",
+        Group.ACCOUNT,
+        ((_F_ACCOUNT_NUMBER, None), (_F_ACCOUNT_DOMAIN, "NUIT")),
+    ),
+    1634: Row(
+        "CNP (Personal Numerical Code)",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "CNP"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1635: Row(
+        "Romanian Permanent Resident",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "ROM_PERM_RES"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, "RO")),
+    ),
+    1636: Row(
+        "Government Gazette Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "GOVT_GAZETTE"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1638: Row(
+        "Fiscal Code",
+        Group.TAX,
+        ((_F_TAX_ID_TYPE, "FISCAL_CODE"), (_F_TAX_ID_NUMBER, None), (_F_TAX_ID_COUNTRY, None)),
+    ),
+    1639: Row(
+        "Pilot License Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "PILOT_LICENSE"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1642: Row(
+        "Romanian C.R.",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "ROMANIAN_CR"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "RO")),
+    ),
+    1643: Row(
+        "Folio Mercantil No.",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "FOLIO"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1644: Row(
+        "Istanbul Chamber of Comm. No.",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "ISTANBUL_CHAMBER"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, "TR")),
+    ),
+    1645: Row(
+        "Turkish Identification Number",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "TURKISH_ID"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "TR")),
+    ),
+    1646: Row(
+        "Romanian Tax Registration",
+        Group.TAX,
+        ((_F_TAX_ID_TYPE, "TAX_REG"), (_F_TAX_ID_NUMBER, None), (_F_TAX_ID_COUNTRY, "RO")),
+    ),
+    1647: Row("Stateless Person Passport", Group.SENZING, ((_F_PASSPORT_NUMBER, None), (_F_PASSPORT_COUNTRY, None))),
+    1648: Row(
+        "Stateless Person ID Card",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "STATELESS_ID"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1649: Row(
+        "Refugee ID Card",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "REFUGEE_ID"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1712: Row(
+        "I.F.E.", Group.OTHER, ((_F_OTHER_ID_TYPE, "IFE"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None))
+    ),
+    1719: Row(
+        "Branch Unit Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "BRANCH_UNIT"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1720: Row(
+        "Enterprise Number",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "ENTERPRISE"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1721: Row(
+        "Organization Code",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "ORG_CODE"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1739: Row(
+        "Citizen's Card Number",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "CITIZEN_CARD"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1740: Row(
+        "UAE Identification",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "UAE_ID"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "AE")),
+    ),
+    1747: Row(
+        "United Social Credit Code Certificate (USCCC)",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "USCCC"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "CN")),
+    ),
+    1751: Row(
+        "Chamber of Commerce Number",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "CHAMBER_COMMERCE"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1752: Row(
+        "Legal Entity Number",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "LEGAL_ENTITY"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1753: Row(
+        "Business Number",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "BUSINESS_NUMBER"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1759: Row(
+        "Birth Certificate Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "BIRTH_CERT"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1760: Row(
+        "Business Registration Number",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "BUS_REG_NUM"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1761: Row(
+        "Registration Number",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "REG_NUMBER"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1812: Row(
+        "MSB Registration Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "MSB_REG"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1835: Row(
+        "File Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "FILE_NUMBER"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    1854: Row(
+        "C.U.I.",
+        Group.NATIONAL,
+        ((_F_NATIONAL_ID_TYPE, "CUI"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, None)),
+    ),
+    1891: Row(
+        "Seafarer's Identification Document",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "SEAFARER_ID"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    2001: Row(
+        "Unified Social Credit Code (USCC)",
+        Group.BUSINESS,
+        ((_F_NATIONAL_ID_TYPE, "USCC"), (_F_NATIONAL_ID_NUMBER, None), (_F_NATIONAL_ID_COUNTRY, "CN")),
+    ),
+    2067: Row(
+        "Central Registration System Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "CENTRAL_REG"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    2121: Row(
+        "Economic Register Number (CBLS)",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "ECON_REG_CBLS"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    2158: Row(
+        "Trademark number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "TRADEMARK"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    2159: Row(
+        "Permit Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "PERMIT"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    2728: Row(
+        "Military Registration Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "MILITARY_REG"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
+    2772: Row(
+        "Russian State Individual Business Registration Number Pattern (OGRNIP)",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "OGRNIP"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, "RU")),
+    ),
+    2790: Row(
+        "Global Intermediary Identification Number",
+        Group.OTHER,
+        ((_F_OTHER_ID_TYPE, "GIIN"), (_F_OTHER_ID_NUMBER, None), (_F_OTHER_ID_COUNTRY, None)),
+    ),
 }
+
+
+def _share_instructions(table: dict) -> None:
+    """Make rows with equal instruction pairs/tuples share one object each."""
+    pairs: dict = {}
+    templates: dict = {}
+    for id_type, (name, group, instructions) in table.items():
+        shared = tuple(pairs.setdefault(pair, pair) for pair in instructions)
+        table[id_type] = Row(name, group, templates.setdefault(shared, shared))
+
+
+_share_instructions(_ID_DOC_MAPPINGS_RAW)
+
+# Read-only view; the table is static for the life of the process.
+ID_DOC_MAPPINGS = MappingProxyType(_ID_DOC_MAPPINGS_RAW)
+
+
+def _template(instructions: tuple) -> tuple:
+    """Return ``(record, slots)``: a read-only view of the output dict with constants
+    filled in and ``None`` placeholders (keeping instruction order), plus the placeholder tags."""
+    record = {FIELD_NAMES[tag]: constant for tag, constant in instructions}
+    slots = tuple(tag for tag, constant in instructions if constant is None)
+    return MappingProxyType(record), slots
+
+
+def _canonical_ids(table: dict) -> dict:
+    """Map every ID to the lowest ID whose instructions are identical to its own."""
+    first: dict = {}
+    for id_type in sorted(table):
+        first.setdefault(table[id_type].instructions, id_type)
+    return {id_type: first[row.instructions] for id_type, row in table.items()}
+
+
+# ``(name, group)`` metadata, indexed by NAME_IDX / GROUP_IDX; the transform
+# loop itself only needs the templates below.
+ID_DOC_META = MappingProxyType({id_type: (row.name, row.group) for id_type, row in _ID_DOC_MAPPINGS_RAW.items()})
+
+# Document types that map identically share one canonical row, e.g. the
+# passport variants 1613/1647 -> 1571 and RFC 1612 -> 1573.
+CANONICAL_ID = MappingProxyType(_canonical_ids(_ID_DOC_MAPPINGS_RAW))
+
+# Precompiled output templates (one per canonical ID, shared by its aliases).
+# Records are read-only; ``record.copy()`` gives a plain dict to fill in.
+_CANONICAL_TEMPLATES = {
+    id_type: _template(_ID_DOC_MAPPINGS_RAW[id_type].instructions) for id_type in set(CANONICAL_ID.values())
+}
+ID_DOC_TEMPLATES = MappingProxyType(
+    {id_type: _CANONICAL_TEMPLATES[canonical] for id_type, canonical in CANONICAL_ID.items()}
+)
@@ -15,12 +15,33 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import multiprocessing
 import re
 import sys
-from collections import defaultdict
+import time
+from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from config.feature_mappings import FEATURE_MAPPINGS
+from config.id_doc_mappings import (
+    FIELD_NAMES,
+    ID_DOC_META,
+    ID_DOC_TEMPLATES,
+    NAME_IDX,
+)
+from parallel_transform import transform_in_workers
 
 try:  # Prefer lxml for speed; fall back to stdlib if unavailable.
     from lxml import etree as ET  # type: ignore
@@ -31,8 +52,16 @@ except ImportError:  # pragma: no cover - executed only when lxml missing.
 
     LXML_AVAILABLE = False
 
-from config.feature_mappings import FEATURE_MAPPINGS
-from config.id_doc_mappings import ID_DOC_MAPPINGS
+
+def _dumps_stdlib(record: Dict) -> bytes:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Serialize one record to compact UTF-8 JSON bytes: orjson when installed, stdlib json otherwise.
+try:
+    from orjson import dumps as _dumps  # type: ignore
+except ImportError:  # pragma: no cover - executed only when orjson missing.
+    _dumps = _dumps_stdlib  # type: ignore[assignment]
 
 NS = {
     "ofac": "https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/ADVANCED_XML",
@@ -40,30 +69,69 @@ NS = {
 }
 
 PARTY_SUBTYPE_TO_RECORD_TYPE = {
-    1: "VESSEL",
-    2: "AIRCRAFT",
-    3: "ORGANIZATION",
-    4: "PERSON",
+    "1": "VESSEL",
+    "2": "AIRCRAFT",
+    "3": "ORGANIZATION",
+    "4": "PERSON",
 }
 
 ALIAS_TYPE_TO_NAME_TYPE = {
-    1400: "AKA",
-    1401: "FKA",
-    1402: "NKA",
-    1403: "PRIMARY",
+    "1400": "AKA",
+    "1401": "FKA",
+    "1402": "NKA",
+    "1403": "PRIMARY",
 }
 
 RELATIONSHIP_ROLE_MAP = {
-    15003: "CONTROLLED_BY",
-    15001: "SUPPORTS",
-    15002: "AGENT_OF",
-    92122: "PROPERTY_OF",
-    91725: "LEADER_OF",
-    15004: "FAMILY_OF",
-    92019: "OWNS_CONTROLS",
-    91422: "SIGNIFICANT_ROLE",
-    91900: "EXECUTIVE_OF",
-    1555: "ASSOCIATE_OF",
+    "15003": "CONTROLLED_BY",
+    "15001": "SUPPORTS",
+    "15002": "AGENT_OF",
+    "92122": "PROPERTY_OF",
+    "91725": "LEADER_OF",
+    "15004": "FAMILY_OF",
+    "92019": "OWNS_CONTROLS",
+    "91422": "SIGNIFICANT_ROLE",
+    "91900": "EXECUTIVE_OF",
+    "1555": "ASSOCIATE_OF",
+}
+
+
+class FeaturePlan(NamedTuple):
+    """How one FeatureTypeID is emitted, resolved once from its ``FEATURE_MAPPINGS`` entry."""
+
+    is_payload: bool
+    instructions: Tuple[Tuple[str, Optional[str]], ...]
+
+
+def _feature_plan(mapping: Dict) -> FeaturePlan:
+    section = mapping["section"]
+    is_payload = "PAYLOAD" in section.upper() or section.startswith("DESCRIPTIVE")
+    return FeaturePlan(is_payload, tuple(mapping["instructions"]))
+
+
+class IdentityDocument(NamedTuple):
+    """The parts of an IDRegDocument used by the transform, extracted while loading."""
+
+    doc_type: str
+    number: str
+    country_id: Optional[str]
+    region: Optional[str]
+
+
+class SanctionsEntry(NamedTuple):
+    """The parts of a SanctionsEntry used by the transform, extracted while loading."""
+
+    list_id: Optional[str]
+    entry_date: Optional[str]
+    # (SanctionsTypeID, cleaned Comment text) per SanctionsMeasure, in document order.
+    measures: Tuple[Tuple[Optional[str], Optional[str]], ...]
+
+
+# Code maps in this module are keyed by the attribute strings as they appear in the
+# XML, so lookups need no int() conversion. The config tables are re-keyed the same way.
+FEATURE_PLANS_BY_CODE = {str(type_id): _feature_plan(mapping) for type_id, mapping in FEATURE_MAPPINGS.items()}
+ID_DOC_TEMPLATES_BY_CODE = {
+    str(doc_type_id): (doc_type_id, template) for doc_type_id, template in ID_DOC_TEMPLATES.items()
 }
 
 NAME_PART_MAP = {
@@ -97,10 +165,233 @@ DATE_ATTRS = {
 
 EMAIL_ATTRS = {"EMAIL_ADDRESS"}
 
+# Spellings of boolean XML attributes treated as true, matched without lowercasing a copy.
+_TRUE_VALUES = frozenset({"true", "True", "TRUE"})
+_FORMER_TRUE_VALUES = _TRUE_VALUES | {"1", "yes", "Yes", "YES"}
+
+# Which extractor fills a dynamic feature attribute; anything not listed takes the feature text.
+ATTR_KINDS: Dict[str, str] = {
+    **{attr: "date" for attr in DATE_ATTRS},
+    **{attr: "country" for attr in COUNTRY_ATTRS},
+    **{attr: "email" for attr in EMAIL_ATTRS},
+    "ADDR_FULL": "address",
+}
+
+
+_NON_IDENTIFIER_CHARS = re.compile(r"[^A-Z0-9]+")
+# str.translate table for upper-cased ASCII names: everything but A-Z and 0-9 becomes "_".
+_IDENTIFIER_TABLE = {code: "_" for code in range(128) if not ("A" <= chr(code) <= "Z" or "0" <= chr(code) <= "9")}
+
+# strptime formats for free-text dates, in order, each behind the prefix a parseable value must have (%Y is
+# four digits, %d/%m one or two), so values that fail every prefix skip strptime and its ValueError.
+_DATE_FORMATS = tuple(
+    (re.compile(prefix), fmt)
+    for prefix, fmt in (
+        (r"\d{4}-", "%Y-%m-%d"),
+        (r"\d{1,2}\s", "%d %b %Y"),
+        (r"\d{1,2}\s", "%d %B %Y"),
+        (r"\d{4}/", "%Y/%m/%d"),
+        (r"\d{1,2}/", "%m/%d/%Y"),
+        (r"\d{4}\.", "%Y.%m.%d"),
+    )
+)
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_identifier_name(name: Optional[str]) -> str:
+    """Upper-case ``name`` into an ``OTHER_ID_TYPE``/role token; cached since only ~100 names recur."""
+    if not name:
+        return "UNKNOWN"
+    upper = name.upper()
+    if not upper.isascii():
+        return _NON_IDENTIFIER_CHARS.sub("_", upper).strip("_") or name
+    # Splitting on "_" and dropping empty pieces collapses separator runs and strips the ends.
+    return "_".join(filter(None, upper.translate(_IDENTIFIER_TABLE).split("_"))) or name
+
+
+# Encoded lines are gathered in one reused bytearray and written out once it reaches this size.
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# A transformed party: the serialized record with its feature, relationship and identifier counts, or None if skipped.
+PartyResult = Optional[Tuple[bytes, int, int, int]]
+# A worker chunk's results, plus the unmapped feature / document type IDs it saw.
+ChunkResult = Tuple[List[PartyResult], Counter[int], Counter[int]]
+
+
+def _qname(prefix: str, local_name: str) -> str:
+    """Return the Clark-notation tag (``{uri}local``) for a prefix from ``NS``."""
+    return f"{{{NS[prefix]}}}{local_name}"
+
+
+_PREFIXED_STEP = re.compile(r"(\w+):([\w-]+)")
+
+
+def _clark_path(path: str) -> str:
+    """Rewrite ``prefix:Name`` steps of an ElementPath to Clark notation so no namespace map is needed."""
+    return _PREFIXED_STEP.sub(lambda match: _qname(match.group(1), match.group(2)), path)
+
+
+_TAG_DISTINCT_PARTY = _qname("ofac", "DistinctParty")
+_TAG_PROFILE_RELATIONSHIP = _qname("ofac", "ProfileRelationship")
+_TAG_ID_REG_DOCUMENT = _qname("ofac", "IDRegDocument")
+_TAG_SANCTIONS_ENTRY = _qname("ofac", "SanctionsEntry")
+_TAG_LOCATION = _qname("ofac", "Location")
+_TAG_VERSION_DETAIL = _qname("ofac", "VersionDetail")
+# Top-level sections transform() skips over; each is freed once parsed.
+_TAG_SECTIONS = frozenset(
+    _qname(prefix, local_name)
+    for prefix in ("ofac", "un")
+    for local_name in ("ReferenceValueSets", "Locations", "IDRegDocuments", "ProfileRelationships", "SanctionsEntries")
+)
+
+
+def _iterparse(xml_path: Path, tags: Iterable[str]) -> Iterator[ET.Element]:
+    """Yield each element with one of ``tags`` once its end tag is parsed (lxml filters the tags in C)."""
+    tag_set = frozenset(tags)
+    parse_options: Dict[str, object] = {}
+    if LXML_AVAILABLE:
+        parse_options.update(
+            tag=list(tag_set),
+            resolve_entities=False,
+            collect_ids=False,
+            huge_tree=True,
+            remove_blank_text=True,
+        )
+    for _, elem in ET.iterparse(str(xml_path), events=("end",), **parse_options):
+        if elem.tag in tag_set:
+            yield elem
+
+
+def _discard(elem: ET.Element) -> None:
+    """Free a processed element and, under lxml, the already-processed siblings before it."""
+    elem.clear()
+    if LXML_AVAILABLE:
+        parent = elem.getparent()
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def _xpath(path: str) -> Callable[[ET.Element], List[ET.Element]]:
+    """Compile a namespaced path once: an lxml ``XPath`` object, or a ``findall`` call on stdlib."""
+    if LXML_AVAILABLE:
+        compile_xpath = getattr(ET, "XPath")  # lxml-only; stdlib ElementTree has no XPath class.
+        return compile_xpath(path, namespaces=NS)
+    clark_path = _clark_path(path)
+    return lambda element: element.findall(clark_path)
+
+
+def _text_query(path: str) -> Callable[[ET.Element], Optional[str]]:
+    """Compile a first-match text query (None without a match): compiled XPath on lxml, C ``findtext`` on stdlib."""
+    if LXML_AVAILABLE:
+        query = _xpath(path)
+
+        def first_text(element: ET.Element) -> Optional[str]:
+            matches = query(element)
+            return (matches[0].text or "") if matches else None
+
+        return first_text
+    clark_path = _clark_path(path)
+    return lambda element: element.findtext(clark_path)
+
+
+def _descendant_country_ids(element: ET.Element) -> Iterable[str]:
+    """CountryID values below ``element`` in document order: one XPath call under lxml, a lazy walk on stdlib."""
+    if _XP_DESCENDANT_COUNTRY_IDS is not None:
+        return _XP_DESCENDANT_COUNTRY_IDS(element)
+    return (cid for child in element.iter() if (cid := child.get("CountryID")))
+
+
+def _first(elements: List[ET.Element]) -> Optional[ET.Element]:
+    return elements[0] if elements else None
+
+
+def _first_match(
+    query: Callable[[ET.Element], List[ET.Element]], elements: Iterable[ET.Element]
+) -> Optional[ET.Element]:
+    """First result of ``query`` across ``elements`` in order, i.e. the first match in document order."""
+    for element in elements:
+        matches = query(element)
+        if matches:
+            return matches[0]
+    return None
+
+
+# Attribute selection is XPath-only; stdlib ElementTree paths cannot express it.
+_XP_DESCENDANT_COUNTRY_IDS = _xpath(".//@CountryID") if LXML_AVAILABLE else None
+_XP_PROFILE = _xpath("ofac:Profile")
+_XP_IDENTITY = _xpath("ofac:Identity")
+_XP_ALIAS = _xpath("ofac:Alias")
+_XP_DOCUMENTED_NAME = _xpath("ofac:DocumentedName")
+_XP_NAME_PART = _xpath("ofac:DocumentedNamePart")
+_XP_FEATURE = _xpath("ofac:Feature")
+_XP_ENTRY_EVENT = _xpath("ofac:EntryEvent")
+_XP_SANCTIONS_MEASURE = _xpath("ofac:SanctionsMeasure")
+_XP_FEATURE_VERSION = _xpath("ofac:FeatureVersion")
+_XP_DATE_PART = _xpath("ofac:DatePart")
+_XP_LOCATION_PARTS = _xpath("ofac:LocationPart")
+_XP_VERSION_LOCATION = _xpath("ofac:VersionLocation")
+_XP_DETAIL_VALUE = _xpath(".//ofac:DetailValue/ofac:Value")
+_XP_ENTRY_DATE = _xpath("ofac:Date")
+_XP_ENTRY_PERIOD = _xpath("ofac:DatePeriod")
+_XP_PERIOD_START = _xpath("ofac:Start")
+
+_TEXT_NAME_PART_VALUE = _text_query("ofac:NamePartValue")
+_TEXT_COMMENT = _text_query("ofac:Comment")
+_TEXT_LOCATION_PART_VALUE_TEXT = _text_query("ofac:LocationPartValue/ofac:Value")
+_TEXT_LOCATION_PART_VALUE = _text_query("ofac:LocationPartValue")
+_TEXT_ID_REGISTRATION_NO = _text_query("ofac:IDRegistrationNo")
+_TEXT_ISSUED_BY_REGION_TEXT = _text_query("ofac:IssuedBy-RegionText")
+_TEXT_YEAR = _text_query("ofac:Year")
+_TEXT_MONTH = _text_query("ofac:Month")
+_TEXT_DAY = _text_query("ofac:Day")
+_TEXT_FROM_YEAR = _text_query("ofac:From/ofac:Year")
+_TEXT_FROM_MONTH = _text_query("ofac:From/ofac:Month")
+_TEXT_FROM_DAY = _text_query("ofac:From/ofac:Day")
+
+
+def _id_field_kind(attr: str) -> str:
+    if attr.endswith("_NUMBER"):
+        return "number"
+    if attr.endswith("_COUNTRY"):
+        return "country"
+    if attr.endswith("_STATE"):
+        return "state"
+    if attr == "ACCOUNT_DOMAIN":
+        return "domain"
+    return "number"
+
+
+# How each ID document field is filled when its constant is None, indexed by field tag.
+ID_FIELD_KINDS = tuple(_id_field_kind(attr) for attr in FIELD_NAMES)
+
 
 class StrictOFACTransformer:
     """Transform OFAC Advanced XML into strict Senzing JSON."""
 
+    # Fixed attribute set: no per-instance __dict__, and slot descriptors for the hot lookups.
+    __slots__ = (
+        "data_source",
+        "country_lookup",
+        "feature_type_lookup",
+        "id_reg_doc_type_lookup",
+        "relation_type_lookup",
+        "sanctions_type_lookup",
+        "detail_reference_lookup",
+        "list_lookup",
+        "location_lookup",
+        "id_doc_name_mappings",
+        "profile_id_to_fixed_ref",
+        "identity_documents",
+        "relationships_by_profile",
+        "sanctions_entries_by_profile",
+        "profile_primary_name",
+        "xml_path",
+        "_unmapped_feature_ids",
+        "_unmapped_doc_ids",
+        "_fallback_id_types",
+        "_attr_extractors",
+    )
+
     def __init__(self, *, data_source: str = "OFAC_ADVANCED") -> None:
         self.data_source = data_source
 
@@ -113,50 +404,60 @@ class StrictOFACTransformer:
         self.list_lookup: Dict[str, str] = {}
 
         self.profile_id_to_fixed_ref: Dict[str, str] = {}
-        self.profile_elements: Dict[str, ET.Element] = {}
         self.relationships_by_profile: Dict[str, List[Dict[str, str]]] = defaultdict(list)
-        self.identity_documents: Dict[str, List[ET.Element]] = defaultdict(list)
-        self.id_doc_name_mappings: Dict[str, Dict[str, object]] = {}
+        self.identity_documents: Dict[str, List[IdentityDocument]] = defaultdict(list)
+        self.id_doc_name_mappings: Dict[str, int] = {}
         self.location_lookup: Dict[str, ET.Element] = {}
-        self.sanctions_entries_by_profile: Dict[str, List[ET.Element]] = defaultdict(list)
-        self.primary_name_cache: Dict[str, str] = {}
-
-        self.root: Optional[ET.Element] = None
-
-        self._warned_feature_ids: set[int] = set()
-        self._warned_doc_ids: set[int] = set()
+        self.sanctions_entries_by_profile: Dict[str, List[SanctionsEntry]] = defaultdict(list)
+        self.profile_primary_name: Dict[str, Optional[str]] = {}
+
+        self.xml_path: Optional[Path] = None
+
+        # Unmapped type IDs seen during transform(), reported once at the end of the run.
+        self._unmapped_feature_ids: Counter[int] = Counter()
+        self._unmapped_doc_ids: Counter[int] = Counter()
+        self._fallback_id_types: Dict[int, str] = {}
+        # Extractors take the feature and its FeatureVersion children, in document order.
+        self._attr_extractors: Dict[str, Callable[[ET.Element, List[ET.Element]], Optional[str]]] = {
+            "date": self._extract_feature_date,
+            "country": self._extract_feature_country,
+            "email": self._extract_feature_email,
+            "address": self._extract_feature_address,
+            "text": self._extract_feature_text,
+        }
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def load(self, xml_path: Path) -> None:
-        """Parse XML and build lookup tables."""
-
-        parser = None
-        if LXML_AVAILABLE:
-            parser = ET.XMLParser(resolve_entities=False)
-        elif hasattr(ET, "XMLParser"):
-            parser = ET.XMLParser()
-
-        tree = ET.parse(str(xml_path), parser=parser) if parser is not None else ET.parse(str(xml_path))
-        self.root = tree.getroot()
-
-        self._build_reference_lookups()
-        self._build_profile_lookup()
-        self._build_relationship_lookup()
-        self._build_location_lookup()
-        self._build_identity_document_lookup()
-        self._build_sanctions_entry_lookup()
+        """Stream the XML once to build lookup tables; parties are re-read by transform()."""
+
+        if not LXML_AVAILABLE:
+            logging.warning(
+                "lxml is not installed; falling back to xml.etree.ElementTree, which is much slower on the "
+                "full OFAC feed (pip install lxml)"
+            )
+
+        handlers = self._lookup_handlers()
+        for elem in _iterparse(xml_path, handlers):
+            handlers[elem.tag](elem)
+
+        self.xml_path = xml_path
         self._build_id_doc_name_lookup()
 
     def transform(
         self,
         *,
         output_jsonl: Path,
+        workers: int = 1,
     ) -> Dict[str, int]:
-        """Transform loaded XML to JSONL, returning processing statistics."""
+        """Transform loaded XML to JSONL, returning processing statistics.
+
+        With ``workers`` > 1, parties are transformed in forked worker processes that
+        inherit the loaded lookups; records are still written in document order.
+        """
 
-        if self.root is None:
+        if self.xml_path is None:
             raise RuntimeError("Transformer not initialized; call load() first")
 
         stats = {
@@ -168,110 +469,151 @@ class StrictOFACTransformer:
             "identifiers": 0,
         }
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
-        with output_jsonl.open("w", encoding="utf-8") as jsonl_file:
-            parties = self.root.findall(".//ofac:DistinctParty", NS)
+        if workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            logging.warning("Parallel transform needs the fork start method; using a single process")
+            workers = 1
+        if workers > 1:
+            results = self._transform_parallel(self.xml_path, workers)
+        else:
+            results = (self._transform_and_encode(party) for party in self._iter_parties(self.xml_path))
 
-            for party in parties:
-                stats["processed"] += 1
+        with output_jsonl.open("wb") as jsonl_file:
+            buffer = bytearray()
 
-                record = self._transform_party(party)
-                if record is None:
+            for result in results:
+                stats["processed"] += 1
+                if result is None:
                     stats["skipped"] += 1
                     continue
 
-                jsonl_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                line, features, relationships, identifiers = result
+                buffer += line
+                buffer += b"\n"
+                if len(buffer) >= _WRITE_BUFFER_BYTES:
+                    jsonl_file.write(buffer)
+                    buffer.clear()
                 stats["emitted"] += 1
-                stats["features"] += len(record["FEATURES"])
-                stats["relationships"] += sum(1 for f in record["FEATURES"] if "REL_POINTER_KEY" in f)
-                stats["identifiers"] += sum(1 for f in record["FEATURES"] if any(k.endswith("_NUMBER") for k in f))
+                stats["features"] += features
+                stats["relationships"] += relationships
+                stats["identifiers"] += identifiers
 
-        duration = datetime.now() - start_time
+            if buffer:
+                jsonl_file.write(buffer)
+
+        duration = time.perf_counter() - start_time
+        self._log_unmapped("FeatureTypeID", self._unmapped_feature_ids)
+        self._log_unmapped("IDRegDocTypeID", self._unmapped_doc_ids)
         logging.info(
-            "Completed %s entities in %s (emitted %s records)",
+            "Completed %s entities in %.1fs (emitted %s records)",
             f"{stats['processed']:,}",
-            str(duration).split(".")[0],
+            duration,
             f"{stats['emitted']:,}",
         )
 
         return stats
 
-    # ------------------------------------------------------------------
-    # Data loading helpers
-    # ------------------------------------------------------------------
-    def _build_reference_lookups(self) -> None:
-        if self.root is None:
-            return
-
-        for country in list(self.root.findall(".//ofac:Country", NS)) + list(self.root.findall(".//un:Country", NS)):
-            country_id = country.get("ID")
-            iso2 = country.get("ISO2")
-            if country_id and iso2:
-                self.country_lookup[country_id] = iso2
+    def _iter_parties(self, xml_path: Path) -> Iterator[ET.Element]:
+        """Stream DistinctParty elements in document order, freeing each once the caller is done with it."""
+        for elem in _iterparse(xml_path, _TAG_SECTIONS | {_TAG_DISTINCT_PARTY}):
+            if elem.tag == _TAG_DISTINCT_PARTY:
+                yield elem
+            _discard(elem)
 
-        for feature_type in list(self.root.findall(".//ofac:FeatureType", NS)) + list(
-            self.root.findall(".//un:FeatureType", NS)
-        ):
-            type_id = feature_type.get("ID")
-            if type_id and feature_type.text:
-                self.feature_type_lookup[type_id] = feature_type.text.strip()
-
-        for doc_type in list(self.root.findall(".//ofac:IDRegDocType", NS)) + list(
-            self.root.findall(".//un:IDRegDocType", NS)
-        ):
-            type_id = doc_type.get("ID")
-            if type_id and doc_type.text:
-                self.id_reg_doc_type_lookup[type_id] = doc_type.text.strip()
-
-        for rel_type in list(self.root.findall(".//ofac:RelationType", NS)) + list(
-            self.root.findall(".//un:RelationType", NS)
-        ):
-            type_id = rel_type.get("ID")
-            if type_id and rel_type.text:
-                self.relation_type_lookup[type_id] = rel_type.text.strip()
+    def _transform_and_encode(self, party: ET.Element) -> PartyResult:
+        record = self._transform_party(party)
+        if record is None:
+            return None
+        features = record["FEATURES"]
+        return (
+            _dumps(record),
+            len(features),
+            sum(1 for f in features if "REL_POINTER_KEY" in f),
+            sum(1 for f in features if any(k.endswith("_NUMBER") for k in f)),
+        )
 
-        for sanctions_type in list(self.root.findall(".//ofac:SanctionsType", NS)) + list(
-            self.root.findall(".//un:SanctionsType", NS)
+    def _transform_parallel(self, xml_path: Path, workers: int) -> Iterator[PartyResult]:
+        """Transform parties in forked workers, yielding results in document order."""
+        parties = (ET.tostring(party) for party in self._iter_parties(xml_path))
+        for results, unmapped_features, unmapped_docs in transform_in_workers(
+            parties, self._transform_serialized, workers
         ):
-            type_id = sanctions_type.get("ID")
-            if type_id and sanctions_type.text:
-                self.sanctions_type_lookup[type_id] = sanctions_type.text.strip()
+            self._unmapped_feature_ids.update(unmapped_features)
+            self._unmapped_doc_ids.update(unmapped_docs)
+            yield from results
 
-        for detail_ref in list(self.root.findall(".//ofac:DetailReference", NS)) + list(
-            self.root.findall(".//un:DetailReference", NS)
-        ):
-            ref_id = detail_ref.get("ID")
-            if ref_id and detail_ref.text:
-                self.detail_reference_lookup[ref_id] = detail_ref.text.strip()
+    def _transform_serialized(self, chunk: List[bytes]) -> ChunkResult:
+        """Transform serialized DistinctParty elements, returning the unmapped IDs seen since the last call."""
+        results = [self._transform_and_encode(ET.fromstring(party_xml)) for party_xml in chunk]
+        unmapped_features, unmapped_docs = self._unmapped_feature_ids, self._unmapped_doc_ids
+        self._unmapped_feature_ids, self._unmapped_doc_ids = Counter(), Counter()
+        return results, unmapped_features, unmapped_docs
 
-        for list_elem in list(self.root.findall(".//ofac:List", NS)) + list(self.root.findall(".//un:List", NS)):
-            list_id = list_elem.get("ID")
-            if list_id and list_elem.text:
-                self.list_lookup[list_id] = list_elem.text.strip()
+    @staticmethod
+    def _log_unmapped(kind: str, counts: Counter[int]) -> None:
+        if counts:
+            logging.warning(
+                "No mapping for %s=%s",
+                kind,
+                ", ".join(f"{type_id} ({count:,}x)" for type_id, count in sorted(counts.items())),
+            )
 
-    def _build_profile_lookup(self) -> None:
-        if self.root is None:
-            return
+    # ------------------------------------------------------------------
+    # Data loading helpers
+    # ------------------------------------------------------------------
+    def _lookup_handlers(self) -> Dict[str, Callable[[ET.Element], None]]:
+        """Map Clark-notation tags to the handler that indexes that element during load()."""
+
+        handlers: Dict[str, Callable[[ET.Element], None]] = {}
+        reference_lookups = {
+            "FeatureType": self.feature_type_lookup,
+            "IDRegDocType": self.id_reg_doc_type_lookup,
+            "RelationType": self.relation_type_lookup,
+            "SanctionsType": self.sanctions_type_lookup,
+            "DetailReference": self.detail_reference_lookup,
+            "List": self.list_lookup,
+        }
+        for prefix in ("ofac", "un"):
+            handlers[_qname(prefix, "Country")] = self._index_country
+            for local_name, lookup in reference_lookups.items():
+                handlers[_qname(prefix, local_name)] = partial(self._index_reference_value, lookup)
+
+        handlers[_TAG_DISTINCT_PARTY] = self._index_party
+        handlers[_TAG_PROFILE_RELATIONSHIP] = self._index_relationship
+        handlers[_TAG_ID_REG_DOCUMENT] = self._index_identity_document
+        handlers[_TAG_SANCTIONS_ENTRY] = self._index_sanctions_entry
+        handlers[_TAG_LOCATION] = self._index_location
+        return handlers
+
+    def _index_country(self, country: ET.Element) -> None:
+        country_id = country.get("ID")
+        iso2 = country.get("ISO2")
+        if country_id and iso2:
+            self.country_lookup[country_id] = sys.intern(iso2)
+        country.clear()
 
-        for party in self.root.findall(".//ofac:DistinctParty", NS):
-            profile = party.find("ofac:Profile", NS)
-            fixed_ref = party.get("FixedRef")
-            if profile is None or not fixed_ref:
-                continue
+    @staticmethod
+    def _index_reference_value(lookup: Dict[str, str], elem: ET.Element) -> None:
+        ref_id = elem.get("ID")
+        if ref_id and elem.text:
+            lookup[ref_id] = sys.intern(elem.text.strip())
+        elem.clear()
+
+    def _index_party(self, party: ET.Element) -> None:
+        profile = _first(_XP_PROFILE(party))
+        fixed_ref = party.get("FixedRef")
+        if profile is not None and fixed_ref:
             profile_id = profile.get("ID")
             if profile_id:
                 self.profile_id_to_fixed_ref[profile_id] = fixed_ref
-                self.profile_elements[profile_id] = party
-
-    def _build_relationship_lookup(self) -> None:
-        if self.root is None:
-            return
+                self.profile_primary_name[profile_id] = self._primary_name(profile)
+        # transform() streams the parties again, so drop this one from the load-time tree.
+        _discard(party)
 
-        for rel in self.root.findall(".//ofac:ProfileRelationship", NS):
-            from_profile = rel.get("From-ProfileID")
-            if not from_profile:
-                continue
+    def _index_relationship(self, rel: ET.Element) -> None:
+        from_profile = rel.get("From-ProfileID")
+        if from_profile:
             rel_info = {
                 "to": rel.get("To-ProfileID"),
                 "type": rel.get("RelationTypeID"),
@@ -279,40 +621,45 @@ class StrictOFACTransformer:
                 "former": rel.get("Former"),
             }
             self.relationships_by_profile[from_profile].append(rel_info)
-
-    def _build_identity_document_lookup(self) -> None:
-        if self.root is None:
-            return
-
-        for doc in self.root.findall(".//ofac:IDRegDocument", NS):
-            identity_id = doc.get("IdentityID")
-            if identity_id:
-                self.identity_documents[identity_id].append(doc)
-
-    def _build_sanctions_entry_lookup(self) -> None:
-        if self.root is None:
-            return
-
-        for entry in self.root.findall(".//ofac:SanctionsEntry", NS):
-            profile_id = entry.get("ProfileID")
-            if profile_id:
-                self.sanctions_entries_by_profile[profile_id].append(entry)
-
-    def _build_location_lookup(self) -> None:
-        if self.root is None:
-            return
-
-        for location in self.root.findall(".//ofac:Location", NS):
-            loc_id = location.get("ID")
-            if loc_id:
-                self.location_lookup[loc_id] = location
+        rel.clear()
+
+    def _index_identity_document(self, doc: ET.Element) -> None:
+        identity_id = doc.get("IdentityID")
+        doc_type = doc.get("IDRegDocTypeID")
+        # Documents without a type or number never produce a feature.
+        number = self._extract_identity_number(doc) if identity_id and doc_type is not None else None
+        if number:
+            self.identity_documents[identity_id].append(
+                IdentityDocument(doc_type, number, doc.get("IssuedBy-CountryID"), self._extract_identity_region(doc))
+            )
+        _discard(doc)
+
+    def _index_sanctions_entry(self, entry: ET.Element) -> None:
+        profile_id = entry.get("ProfileID")
+        if profile_id:
+            events = _XP_ENTRY_EVENT(entry)
+            # Primary dates are uniform per entry, so only the first event is read.
+            entry_date = self._extract_entry_event_date(events[0]) if events else None
+            measures = []
+            for measure in _XP_SANCTIONS_MEASURE(entry):
+                comment_text = self._clean_text(_TEXT_COMMENT(measure))
+                measures.append((measure.get("SanctionsTypeID"), comment_text))
+            self.sanctions_entries_by_profile[profile_id].append(
+                SanctionsEntry(entry.get("ListID"), entry_date, tuple(measures))
+            )
+        _discard(entry)
+
+    def _index_location(self, location: ET.Element) -> None:
+        loc_id = location.get("ID")
+        if loc_id:
+            self.location_lookup[loc_id] = location
 
     def _build_id_doc_name_lookup(self) -> None:
         # Build normalized-name lookup from static mapping table for fallback by name.
-        for entry in ID_DOC_MAPPINGS.values():
-            normalized = self._sanitize_identifier_name(entry["name"]) if entry.get("name") else None
+        for id_type, meta in ID_DOC_META.items():
+            normalized = _sanitize_identifier_name(meta[NAME_IDX]) if meta[NAME_IDX] else None
             if normalized:
-                self.id_doc_name_mappings[normalized] = entry
+                self.id_doc_name_mappings[normalized] = id_type
 
     # ------------------------------------------------------------------
     # Entity transformation
@@ -328,15 +675,17 @@ class StrictOFACTransformer:
             "FEATURES": [],
         }
 
-        profile = party.find("ofac:Profile", NS)
+        profile = _first(_XP_PROFILE(party))
         if profile is None:
             return None
 
+        identities = _XP_IDENTITY(profile)
+
         self._add_record_type(record, profile)
-        self._add_names(record, party)
+        self._add_names(record, identities)
 
-        max_reliability = self._add_features(record, party)
-        self._add_identity_documents(record, party)
+        max_reliability = self._add_features(record, profile)
+        self._add_identity_documents(record, identities)
 
         # Relationship anchor
         record["FEATURES"].append(
@@ -352,224 +701,179 @@ class StrictOFACTransformer:
         return record
 
     def _add_record_type(self, record: Dict, profile: ET.Element) -> None:
-        subtype = profile.get("PartySubTypeID")
-        if not subtype:
-            return
-        try:
-            subtype_code = int(subtype)
-        except ValueError:
-            return
-        record_type = PARTY_SUBTYPE_TO_RECORD_TYPE.get(subtype_code)
+        record_type = PARTY_SUBTYPE_TO_RECORD_TYPE.get(profile.get("PartySubTypeID"))
         if record_type:
             record["FEATURES"].append({"RECORD_TYPE": record_type})
 
-    def _add_names(self, record: Dict, party: ET.Element) -> None:
-        for alias in party.findall(".//ofac:Alias", NS):
-            is_primary = alias.get("Primary", "").lower() == "true"
-            alias_type_id = alias.get("AliasTypeID")
-
-            for documented_name in alias.findall("ofac:DocumentedName", NS):
-                name_feature: Dict[str, str] = {}
-                parts: List[str] = []
-
-                for part in documented_name.findall("ofac:DocumentedNamePart", NS):
-                    value_elem = part.find("ofac:NamePartValue", NS)
-                    text = self._clean_text(value_elem.text if value_elem is not None else None)
-                    if not text:
+    def _add_names(self, record: Dict, identities: List[ET.Element]) -> None:
+        for identity in identities:
+            for alias in _XP_ALIAS(identity):
+                is_primary = alias.get("Primary") in _TRUE_VALUES
+                alias_type_id = alias.get("AliasTypeID")
+
+                for documented_name in _XP_DOCUMENTED_NAME(alias):
+                    name_feature: Dict[str, str] = {}
+                    parts: List[str] = []
+
+                    for part in _XP_NAME_PART(documented_name):
+                        text = self._clean_text(_TEXT_NAME_PART_VALUE(part))
+                        if not text:
+                            continue
+                        parts.append(text)
+                        name_attr = NAME_PART_MAP.get(part.get("NamePartTypeID"))
+                        if name_attr and name_attr not in name_feature:
+                            name_feature[name_attr] = text
+
+                    if not parts:
                         continue
-                    parts.append(text)
-                    name_attr = NAME_PART_MAP.get(part.get("NamePartTypeID", ""))
-                    if name_attr and name_attr not in name_feature:
-                        name_feature[name_attr] = text
 
-                if not parts:
-                    continue
-
-                name_feature["NAME_FULL"] = " ".join(parts)
+                    name_feature["NAME_FULL"] = " ".join(parts)
 
-                if is_primary:
-                    name_feature["NAME_TYPE"] = "PRIMARY"
-                elif alias_type_id:
-                    try:
-                        mapped = ALIAS_TYPE_TO_NAME_TYPE[int(alias_type_id)]
-                        name_feature["NAME_TYPE"] = mapped
-                    except (ValueError, KeyError):
-                        name_feature["NAME_TYPE"] = "AKA"
-                else:
-                    name_feature["NAME_TYPE"] = "AKA"
+                    if is_primary:
+                        name_feature["NAME_TYPE"] = "PRIMARY"
+                    else:
+                        name_feature["NAME_TYPE"] = ALIAS_TYPE_TO_NAME_TYPE.get(alias_type_id, "AKA")
 
-                record["FEATURES"].append(name_feature)
+                    record["FEATURES"].append(name_feature)
 
-    def _add_features(self, record: Dict, party: ET.Element) -> Optional[int]:
+    def _add_features(self, record: Dict, profile: ET.Element) -> Optional[int]:
         max_reliability: Optional[int] = None
 
-        for feature in party.findall(".//ofac:Feature", NS):
+        for feature in _XP_FEATURE(profile):
             feature_type = feature.get("FeatureTypeID")
             if feature_type is None:
                 continue
 
-            try:
-                type_id = int(feature_type)
-            except ValueError:
-                continue
+            plan = FEATURE_PLANS_BY_CODE.get(feature_type)
+            if plan is None:
+                try:
+                    type_id = int(feature_type)
+                except ValueError:
+                    continue
 
-            reliability = self._extract_reliability(feature)
+            # Extractors search every FeatureVersion in order; reliability comes from the first.
+            feature_versions = _XP_FEATURE_VERSION(feature)
+            reliability = self._extract_reliability(_first(feature_versions))
             if reliability is not None:
                 max_reliability = reliability if max_reliability is None else max(max_reliability, reliability)
 
-            mapping_info = FEATURE_MAPPINGS.get(type_id)
-            if mapping_info is None:
-                fallback = self._fallback_other_id_feature(type_id, feature)
+            if plan is None:
+                fallback = self._fallback_other_id_feature(type_id, feature, feature_versions)
                 if fallback:
                     record["FEATURES"].append(fallback)
-                elif type_id not in self._warned_feature_ids:
-                    logging.warning("No mapping for FeatureTypeID=%s", type_id)
-                    self._warned_feature_ids.add(type_id)
+                else:
+                    self._unmapped_feature_ids[type_id] += 1
                 continue
 
-            target = "payload" if "PAYLOAD" in mapping_info["section"].upper() else "feature"
-            if mapping_info["section"].startswith("DESCRIPTIVE"):
-                target = "payload"
-
-            values = self._build_attribute_dict(feature, mapping_info["instructions"])
+            is_payload, instructions = plan
+            values = self._build_attribute_dict(feature, feature_versions, instructions)
             if not values:
                 continue
 
-            if target == "feature":
+            if not is_payload:
                 record["FEATURES"].append(values)
             else:
                 for key, value in values.items():
                     if value in (None, ""):
                         continue
-                    if key not in record:
-                        record[key] = value
-                    elif record[key] != value:
-                        # In the unlikely case of conflicting payload values, prefer first.
-                        continue
+                    # In the unlikely case of conflicting payload values, prefer first.
+                    record.setdefault(key, value)
 
         return max_reliability
 
     def _build_attribute_dict(
-        self, feature: ET.Element, instructions: Iterable[Tuple[str, Optional[str]]]
+        self,
+        feature: ET.Element,
+        feature_versions: List[ET.Element],
+        instructions: Iterable[Tuple[str, Optional[str]]],
     ) -> Optional[Dict[str, object]]:
         attr_values: Dict[str, object] = {}
 
-        text_value = self._extract_feature_text(feature)
-        date_value = self._extract_feature_date(feature)
-        country_value = self._extract_country_code(feature)
-        address_details = self._extract_address_details(feature)
-        address_value = address_details.get("full") if address_details else None
-        if not country_value and address_details and address_details.get("country"):
-            country_value = address_details["country"]
-
+        # Only the extractor an attribute needs is run; mappings carry a single dynamic attribute.
         for attr, constant in instructions:
             if constant is not None:
                 attr_values[attr] = constant
                 continue
 
-            if attr in DATE_ATTRS:
-                if date_value:
-                    attr_values[attr] = date_value
-            elif attr in COUNTRY_ATTRS:
-                if country_value:
-                    attr_values[attr] = country_value
-            elif attr in EMAIL_ATTRS:
-                if text_value:
-                    attr_values[attr] = text_value.lower()
-            elif attr == "ADDR_FULL":
-                if address_value:
-                    attr_values[attr] = address_value
-                elif text_value:
-                    attr_values[attr] = text_value
-            elif attr == "REGISTRATION_COUNTRY":
-                if country_value:
-                    attr_values[attr] = country_value
-            else:
-                if text_value:
-                    attr_values[attr] = text_value
+            value = self._attr_extractors[ATTR_KINDS.get(attr, "text")](feature, feature_versions)
 
-        # Ensure required dynamic attributes present.
-        for attr, constant in instructions:
-            if constant is not None:
-                continue
-            if attr not in attr_values:
+            # Every dynamic attribute is required; bail out on the first one without a value.
+            if not value:
                 return None
+            attr_values[attr] = value
 
         return attr_values or None
 
-    def _fallback_other_id_feature(self, feature_type_id: int, feature: ET.Element) -> Optional[Dict[str, str]]:
-        text_value = self._extract_feature_text(feature)
+    def _fallback_other_id_feature(
+        self, feature_type_id: int, feature: ET.Element, feature_versions: List[ET.Element]
+    ) -> Optional[Dict[str, str]]:
+        text_value = self._extract_feature_text(feature, feature_versions)
         if not text_value:
             return None
-        feature_name = self.feature_type_lookup.get(str(feature_type_id), f"FEATURE_{feature_type_id}")
-        type_value = re.sub(r"[^A-Z0-9]+", "_", feature_name.upper()).strip("_") or feature_name
+        type_value = self._fallback_id_types.get(feature_type_id)
+        if type_value is None:
+            feature_name = self.feature_type_lookup.get(str(feature_type_id), f"FEATURE_{feature_type_id}")
+            type_value = _sanitize_identifier_name(feature_name) if feature_name else feature_name
+            self._fallback_id_types[feature_type_id] = type_value
         return {
             "OTHER_ID_TYPE": type_value,
             "OTHER_ID_NUMBER": text_value,
         }
 
-    def _add_identity_documents(self, record: Dict, party: ET.Element) -> None:
-        identities = party.findall(".//ofac:Identity", NS)
+    def _add_identity_documents(self, record: Dict, identities: List[ET.Element]) -> None:
         for identity in identities:
             identity_id = identity.get("ID")
             if not identity_id:
                 continue
 
-            for doc in self.identity_documents.get(identity_id, []):
-                doc_type = doc.get("IDRegDocTypeID")
-                if doc_type is None:
-                    continue
-
-                try:
-                    doc_type_id = int(doc_type)
-                except ValueError:
-                    continue
-
-                doc_number = self._extract_identity_number(doc)
-                if not doc_number:
-                    continue
+            for doc_type, doc_number, country_id, region in self.identity_documents.get(identity_id, []):
+                mapped_id: Optional[int]
+                mapped_id, template = ID_DOC_TEMPLATES_BY_CODE.get(doc_type, (None, None))
+                if template is None:
+                    try:
+                        doc_type_id = int(doc_type)
+                    except ValueError:
+                        continue
 
-                mapping = ID_DOC_MAPPINGS.get(doc_type_id)
-                if mapping is None:
+                country = self.country_lookup.get(country_id) if country_id else None
+                if template is None:
                     doc_type_name = self.id_reg_doc_type_lookup.get(str(doc_type_id))
                     if doc_type_name:
-                        normalized_name = self._sanitize_identifier_name(doc_type_name)
-                        mapping = self.id_doc_name_mappings.get(normalized_name)
-                if mapping is None:
-                    if doc_type_id not in self._warned_doc_ids:
-                        logging.warning("No mapping for IDRegDocTypeID=%s", doc_type_id)
-                        self._warned_doc_ids.add(doc_type_id)
+                        normalized_name = _sanitize_identifier_name(doc_type_name)
+                        mapped_id = self.id_doc_name_mappings.get(normalized_name)
+                        if mapped_id is not None:
+                            template = ID_DOC_TEMPLATES[mapped_id]
+                if template is None or mapped_id is None:
+                    self._unmapped_doc_ids[doc_type_id] += 1
                     fallback = {
-                        "OTHER_ID_TYPE": self._sanitize_identifier_name(
+                        "OTHER_ID_TYPE": _sanitize_identifier_name(
                             self.id_reg_doc_type_lookup.get(str(doc_type_id), f"DOCTYPE_{doc_type_id}")
                         ),
                         "OTHER_ID_NUMBER": doc_number,
                     }
-                    country = self._extract_identity_country(doc)
                     if country:
                         fallback["OTHER_ID_COUNTRY"] = country
                     record["FEATURES"].append(fallback)
                     continue
 
-                feature_obj: Dict[str, object] = {}
-                country = self._extract_identity_country(doc)
-
-                for attr, constant in mapping["instructions"]:
-                    if constant is not None:
-                        feature_obj[attr] = constant
-                    elif attr.endswith("_NUMBER"):
-                        feature_obj[attr] = doc_number
-                    elif attr.endswith("_COUNTRY"):
-                        if country:
-                            feature_obj[attr] = country
-                    elif attr.endswith("_STATE"):
-                        region = self._extract_identity_region(doc)
-                        if region:
-                            feature_obj[attr] = region
-                    elif attr == "ACCOUNT_DOMAIN":
-                        feature_obj[attr] = self._sanitize_identifier_name(mapping["name"])
+                template_record, slots = template
+                feature_obj: Dict[str, object] = template_record.copy()
+
+                for tag in slots:
+                    kind = ID_FIELD_KINDS[tag]
+                    value: Optional[str]
+                    if kind == "number":
+                        value = doc_number
+                    elif kind == "country":
+                        value = country
+                    elif kind == "state":
+                        value = region
+                    else:
+                        value = _sanitize_identifier_name(ID_DOC_META[mapped_id][NAME_IDX])
+                    if value:
+                        feature_obj[FIELD_NAMES[tag]] = value
                     else:
-                        feature_obj[attr] = doc_number
+                        del feature_obj[FIELD_NAMES[tag]]
 
                 if feature_obj:
                     record["FEATURES"].append(feature_obj)
@@ -612,25 +916,17 @@ class StrictOFACTransformer:
         sanction_types: List[str] = []
         entry_dates: List[str] = []
 
-        for entry in entries:
-            list_id = entry.get("ListID")
+        for list_id, entry_date, measures in entries:
             if list_id:
                 list_name = self.list_lookup.get(list_id, list_id)
                 normalized = self._normalize_list_name(list_name)
                 if normalized and normalized not in list_names:
                     list_names.append(normalized)
 
-            for event in entry.findall("ofac:EntryEvent", NS):
-                event_date = self._extract_entry_event_date(event)
-                if event_date:
-                    entry_dates.append(event_date)
-                break  # Primary dates are uniform per entry
-
-            for measure in entry.findall("ofac:SanctionsMeasure", NS):
-                measure_type = measure.get("SanctionsTypeID")
-                comment_elem = measure.find("ofac:Comment", NS)
-                comment_text = self._clean_text(comment_elem.text if comment_elem is not None else None)
+            if entry_date:
+                entry_dates.append(entry_date)
 
+            for measure_type, comment_text in measures:
                 if measure_type == "1":
                     if comment_text and comment_text not in program_codes:
                         program_codes.append(comment_text)
@@ -654,7 +950,7 @@ class StrictOFACTransformer:
 
         primary_attr = profile.get("Primary")
         if primary_attr:
-            record.setdefault("IS_PRIMARY", primary_attr.lower() == "true")
+            record.setdefault("IS_PRIMARY", primary_attr in _TRUE_VALUES)
 
         if max_reliability is not None:
             record.setdefault("DATA_QUALITY_SCORE", max_reliability)
@@ -668,19 +964,17 @@ class StrictOFACTransformer:
         rel_type = rel.get("type")
         role_value: Optional[str] = None
         if rel_type:
-            try:
-                rel_type_id = int(rel_type)
-            except ValueError:
-                rel_type_id = None
-            if rel_type_id is not None:
-                role = RELATIONSHIP_ROLE_MAP.get(rel_type_id)
-                if role is None:
+            role_value = RELATIONSHIP_ROLE_MAP.get(rel_type)
+            if role_value is None:
+                try:
+                    rel_type_id = int(rel_type)
+                except ValueError:
+                    rel_type_id = None
+                if rel_type_id is not None:
                     role_name = self.relation_type_lookup.get(rel_type, f"RELATION_{rel_type_id}")
-                    role = self._sanitize_identifier_name(role_name)
-                role_value = role
+                    role_value = _sanitize_identifier_name(role_name)
 
-        former = rel.get("former", "").lower()
-        if former in {"true", "1", "yes"}:
+        if rel.get("former") in _FORMER_TRUE_VALUES:
             if role_value:
                 if not role_value.startswith("FORMER_"):
                     role_value = f"FORMER_{role_value}"
@@ -695,28 +989,27 @@ class StrictOFACTransformer:
         trimmed = name.strip()
         if not trimmed:
             return None
-        lowered = trimmed.lower()
-        if lowered.endswith(" list"):
+        if trimmed[-len(" list") :].lower() == " list":
             trimmed = trimmed[: -len(" list")].strip()
         return trimmed
 
     def _extract_entry_event_date(self, entry_event: ET.Element) -> Optional[str]:
-        date_elem = entry_event.find("ofac:Date", NS)
+        date_elem = _first(_XP_ENTRY_DATE(entry_event))
         if date_elem is not None:
-            year = self._clean_text(date_elem.findtext("ofac:Year", default="", namespaces=NS))
-            month = self._clean_text(date_elem.findtext("ofac:Month", default="", namespaces=NS))
-            day = self._clean_text(date_elem.findtext("ofac:Day", default="", namespaces=NS))
+            year = self._clean_text(_TEXT_YEAR(date_elem))
+            month = self._clean_text(_TEXT_MONTH(date_elem))
+            day = self._clean_text(_TEXT_DAY(date_elem))
             formatted = self._format_date_parts(year, month, day)
             if formatted:
                 return formatted
 
-        date_period = entry_event.find("ofac:DatePeriod", NS)
+        date_period = _first(_XP_ENTRY_PERIOD(entry_event))
         if date_period is not None:
-            start = date_period.find("ofac:Start", NS)
+            start = _first(_XP_PERIOD_START(date_period))
             if start is not None:
-                year = self._clean_text(start.findtext("ofac:From/ofac:Year", default="", namespaces=NS))
-                month = self._clean_text(start.findtext("ofac:From/ofac:Month", default="", namespaces=NS))
-                day = self._clean_text(start.findtext("ofac:From/ofac:Day", default="", namespaces=NS))
+                year = self._clean_text(_TEXT_FROM_YEAR(start))
+                month = self._clean_text(_TEXT_FROM_MONTH(start))
+                day = self._clean_text(_TEXT_FROM_DAY(start))
                 formatted = self._format_date_parts(year, month, day)
                 if formatted:
                     return formatted
@@ -739,40 +1032,29 @@ class StrictOFACTransformer:
         return remarks
 
     def _get_primary_name_for_profile(self, profile_id: str) -> Optional[str]:
-        cached = self.primary_name_cache.get(profile_id)
-        if cached is not None:
-            return cached
-
-        party = self.profile_elements.get(profile_id)
-        if party is None:
-            return None
-
-        profile_elem = party.find("ofac:Profile", NS)
-        if profile_elem is None:
-            return None
+        return self.profile_primary_name.get(profile_id)
 
-        identities = profile_elem.findall("ofac:Identity", NS)
+    def _primary_name(self, profile: ET.Element) -> Optional[str]:
+        """Name shown for a profile in relationship remarks, computed once while indexing parties."""
         aliases: List[ET.Element] = []
-        for identity in identities:
-            aliases.extend(identity.findall("ofac:Alias", NS))
+        for identity in _XP_IDENTITY(profile):
+            aliases.extend(_XP_ALIAS(identity))
 
-        primary_aliases = [alias for alias in aliases if alias.get("Primary", "").lower() == "true"]
+        primary_aliases = [alias for alias in aliases if alias.get("Primary") in _TRUE_VALUES]
         search_aliases = primary_aliases or aliases
 
         for alias in search_aliases:
             name = self._compose_alias_name(alias)
             if name:
-                self.primary_name_cache[profile_id] = name
                 return name
 
         return None
 
     def _compose_alias_name(self, alias: ET.Element) -> Optional[str]:
-        for documented_name in alias.findall("ofac:DocumentedName", NS):
+        for documented_name in _XP_DOCUMENTED_NAME(alias):
             parts: List[str] = []
-            for part in documented_name.findall("ofac:DocumentedNamePart", NS):
-                value_elem = part.find("ofac:NamePartValue", NS)
-                text = self._clean_text(value_elem.text if value_elem is not None else None)
+            for part in _XP_NAME_PART(documented_name):
+                text = self._clean_text(_TEXT_NAME_PART_VALUE(part))
                 if text:
                     parts.append(text)
             if parts:
@@ -782,39 +1064,60 @@ class StrictOFACTransformer:
     # ------------------------------------------------------------------
     # Extraction helpers
     # ------------------------------------------------------------------
-    def _extract_feature_text(self, feature: ET.Element) -> Optional[str]:
-        version_details = feature.findall("ofac:FeatureVersion/ofac:VersionDetail", NS)
-        if not version_details:
-            version_detail = feature.find("ofac:VersionDetail", NS)
-            version_details = [version_detail] if version_detail is not None else []
-
-        for version_detail in version_details:
-            text = self._clean_text(version_detail.text if version_detail is not None else None)
+    def _extract_feature_text(self, feature: ET.Element, feature_versions: List[ET.Element]) -> Optional[str]:
+        # Walk the versions' details lazily to the first usable one; without any, use the feature's own VersionDetail.
+        version_details = (detail for version in feature_versions for detail in version.iterfind(_TAG_VERSION_DETAIL))
+        version_detail = next(version_details, None)
+        if version_detail is None:
+            version_detail = feature.find(_TAG_VERSION_DETAIL)
+
+        while version_detail is not None:
+            text = self._clean_text(version_detail.text)
             if text:
                 return text
 
-            ref_id = version_detail.get("DetailReferenceID") if version_detail is not None else None
+            ref_id = version_detail.get("DetailReferenceID")
             if ref_id:
                 ref_text = self.detail_reference_lookup.get(ref_id)
                 if ref_text:
                     return ref_text
+            version_detail = next(version_details, None)
+
+        return None
 
+    def _extract_feature_country(self, feature: ET.Element, feature_versions: List[ET.Element]) -> Optional[str]:
+        country = self._extract_country_code(feature)
+        if country:
+            return country
+        # Otherwise the country of the referenced Location, provided the feature has an address at all.
+        location_elem = self._version_location(feature_versions)
+        if location_elem is None:
+            return None
+        country = self._extract_country_code(location_elem)
+        if country and self._extract_address_full(feature, feature_versions, location_elem):
+            return country
         return None
 
-    def _extract_feature_date(self, feature: ET.Element) -> Optional[str]:
-        date_part = feature.find("ofac:FeatureVersion/ofac:DatePart", NS)
+    def _extract_feature_email(self, feature: ET.Element, feature_versions: List[ET.Element]) -> Optional[str]:
+        text_value = self._extract_feature_text(feature, feature_versions)
+        return text_value.lower() if text_value else None
+
+    def _extract_feature_address(self, feature: ET.Element, feature_versions: List[ET.Element]) -> Optional[str]:
+        location_elem = self._version_location(feature_versions)
+        address = self._extract_address_full(feature, feature_versions, location_elem)
+        return address or self._extract_feature_text(feature, feature_versions)
+
+    def _extract_feature_date(self, feature: ET.Element, feature_versions: List[ET.Element]) -> Optional[str]:
+        date_part = _first_match(_XP_DATE_PART, feature_versions)
         if date_part is not None:
-            year_elem = date_part.find("ofac:Year", NS)
-            month_elem = date_part.find("ofac:Month", NS)
-            day_elem = date_part.find("ofac:Day", NS)
-            year = self._clean_text(year_elem.text if year_elem is not None else None)
-            month = self._clean_text(month_elem.text if month_elem is not None else None)
-            day = self._clean_text(day_elem.text if day_elem is not None else None)
+            year = self._clean_text(_TEXT_YEAR(date_part))
+            month = self._clean_text(_TEXT_MONTH(date_part))
+            day = self._clean_text(_TEXT_DAY(date_part))
             formatted = self._format_date_parts(year, month, day)
             if formatted:
                 return formatted
 
-        text_value = self._extract_feature_text(feature)
+        text_value = self._extract_feature_text(feature, feature_versions)
         if text_value:
             parsed = self._normalize_date_string(text_value)
             if parsed:
@@ -826,71 +1129,46 @@ class StrictOFACTransformer:
         if country_id and country_id in self.country_lookup:
             return self.country_lookup[country_id]
 
-        for child in element.iter():
-            cid = child.get("CountryID")
-            if cid and cid in self.country_lookup:
+        for cid in _descendant_country_ids(element):
+            if cid in self.country_lookup:
                 return self.country_lookup[cid]
         return None
 
-    def _extract_address_details(self, feature: ET.Element) -> Optional[Dict[str, Optional[str]]]:
-        components: List[str] = []
-        seen: set[str] = set()
-        country = self._extract_country_code(feature)
-
-        def add_component(value: Optional[str]) -> None:
-            if not value:
-                return
-            if value not in seen:
-                components.append(value)
-                seen.add(value)
-
-        def collect_location_parts(element: ET.Element) -> None:
-            for part in element.findall("ofac:LocationPart", NS):
-                value_elem = part.find("ofac:LocationPartValue/ofac:Value", NS)
-                if value_elem is None:
-                    value_elem = part.find("ofac:LocationPartValue", NS)
-                value = self._clean_text(value_elem.text if value_elem is not None else None)
-                add_component(value)
-
-        # Direct location parts inside the feature version
-        for part in feature.findall("ofac:FeatureVersion/ofac:LocationPart", NS):
-            value_elem = part.find("ofac:LocationPartValue/ofac:Value", NS)
-            if value_elem is None:
-                value_elem = part.find("ofac:LocationPartValue", NS)
-            value = self._clean_text(value_elem.text if value_elem is not None else None)
-            add_component(value)
-
-        # Location parts directly under the feature
-        for part in feature.findall("ofac:LocationPart", NS):
-            value_elem = part.find("ofac:LocationPartValue/ofac:Value", NS)
-            if value_elem is None:
-                value_elem = part.find("ofac:LocationPartValue", NS)
-            value = self._clean_text(value_elem.text if value_elem is not None else None)
-            add_component(value)
-
-        # Resolve VersionLocation references to the Locations table
-        version_location = feature.find("ofac:FeatureVersion/ofac:VersionLocation", NS)
-        if version_location is not None:
-            loc_id = version_location.get("LocationID")
-            if loc_id:
-                location_elem = self.location_lookup.get(loc_id)
-                if location_elem is not None:
-                    loc_country = self._extract_country_code(location_elem)
-                    if loc_country and not country:
-                        country = loc_country
-                    collect_location_parts(location_elem)
-
-        if not components:
-            text_value = self._extract_feature_text(feature)
-            add_component(text_value)
+    def _version_location(self, feature_versions: List[ET.Element]) -> Optional[ET.Element]:
+        """Return the Location a feature references through VersionLocation, if it is known."""
+        version_location = _first_match(_XP_VERSION_LOCATION, feature_versions)
+        loc_id = version_location.get("LocationID") if version_location is not None else None
+        return self.location_lookup.get(loc_id) if loc_id else None
+
+    def _extract_address_full(
+        self, feature: ET.Element, feature_versions: List[ET.Element], location_elem: Optional[ET.Element]
+    ) -> Optional[str]:
+        # Keys keep first-seen order, so the dict doubles as an ordered set.
+        components: Dict[str, None] = {}
+
+        # Location parts in the feature versions, then directly under the feature, then in the referenced Location.
+        parts = [part for version in feature_versions for part in _XP_LOCATION_PARTS(version)]
+        parts += _XP_LOCATION_PARTS(feature)
+        if location_elem is not None:
+            parts += _XP_LOCATION_PARTS(location_elem)
+
+        for part in parts:
+            # A Value element wins even when empty; only without one is LocationPartValue's own text used.
+            text = _TEXT_LOCATION_PART_VALUE_TEXT(part)
+            if text is None:
+                text = _TEXT_LOCATION_PART_VALUE(part)
+            value = self._clean_text(text)
+            if value:
+                components[value] = None
 
         if not components:
-            return None
+            text_value = self._extract_feature_text(feature, feature_versions)
+            if text_value:
+                components[text_value] = None
 
-        return {"full": ", ".join(components), "country": country}
+        return ", ".join(components) if components else None
 
-    def _extract_reliability(self, feature: ET.Element) -> Optional[int]:
-        feature_version = feature.find("ofac:FeatureVersion", NS)
+    def _extract_reliability(self, feature_version: Optional[ET.Element]) -> Optional[int]:
         if feature_version is None:
             return None
         reliability = feature_version.get("ReliabilityID")
@@ -902,13 +1180,11 @@ class StrictOFACTransformer:
             return None
 
     def _extract_identity_number(self, doc: ET.Element) -> Optional[str]:
-        direct = doc.find("ofac:IDRegistrationNo", NS)
-        if direct is not None and direct.text:
-            value = self._clean_text(direct.text)
-            if value:
-                return value
+        value = self._clean_text(_TEXT_ID_REGISTRATION_NO(doc))
+        if value:
+            return value
 
-        detail_value = doc.find(".//ofac:DetailValue/ofac:Value", NS)
+        detail_value = _first(_XP_DETAIL_VALUE(doc))
         if detail_value is not None and detail_value.text:
             value = self._clean_text(detail_value.text)
             if value:
@@ -916,17 +1192,8 @@ class StrictOFACTransformer:
 
         return None
 
-    def _extract_identity_country(self, doc: ET.Element) -> Optional[str]:
-        country_id = doc.get("IssuedBy-CountryID")
-        if country_id and country_id in self.country_lookup:
-            return self.country_lookup[country_id]
-        return None
-
     def _extract_identity_region(self, doc: ET.Element) -> Optional[str]:
-        region_elem = doc.find("ofac:IssuedBy-RegionText", NS)
-        if region_elem is not None and region_elem.text:
-            return self._clean_text(region_elem.text)
-        return None
+        return self._clean_text(_TEXT_ISSUED_BY_REGION_TEXT(doc))
 
     # ------------------------------------------------------------------
     # Utility helpers
@@ -963,25 +1230,21 @@ class StrictOFACTransformer:
         if not value:
             return None
 
-        for fmt in ("%Y-%m-%d", "%d %b %Y", "%d %B %Y", "%Y/%m/%d", "%m/%d/%Y", "%Y.%m.%d"):
+        if value.isdigit() and len(value) == 4:
+            return value
+        for prefix, fmt in _DATE_FORMATS:
+            if not prefix.match(value):
+                continue
             try:
                 return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
             except ValueError:
                 continue
-        if value.isdigit() and len(value) == 4:
-            return value
-        iso_match = re.match(r"^(\d{4})-(\d{2})(?:-(\d{2}))?", value)
-        if iso_match:
-            year, month, day = iso_match.group(1), iso_match.group(2), iso_match.group(3)
-            return StrictOFACTransformer._format_date_parts(year, month, day)
+        # Leading YYYY-MM[-DD]; isdecimal() accepts exactly what a regex \d does.
+        if len(value) >= 7 and value[4] == "-" and value[:4].isdecimal() and value[5:7].isdecimal():
+            day = value[8:10] if value[7:8] == "-" and len(value) >= 10 and value[8:10].isdecimal() else None
+            return StrictOFACTransformer._format_date_parts(value[:4], value[5:7], day)
         return None
 
-    @staticmethod
-    def _sanitize_identifier_name(name: Optional[str]) -> str:
-        if not name:
-            return "UNKNOWN"
-        return re.sub(r"[^A-Z0-9]+", "_", name.upper()).strip("_") or name
-
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -995,6 +1258,12 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=Path("ofac_strict.jsonl"),
         help="Destination JSONL file (default: ofac_strict.jsonl)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for the transform phase (default: 1; requires fork support)",
+    )
     return parser.parse_args(argv)
 
 
@@ -1012,6 +1281,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     stats = transformer.transform(
         output_jsonl=args.output_jsonl,
+        workers=args.workers,
     )
 
     logging.info(
@@ -0,0 +1,55 @@
+"""Run the transform phase over chunks of serialized parties in forked worker processes.
+
+The parent hands the loaded transformer's chunk method to ``transform_in_workers``;
+forked workers inherit it through ``_WORKER_STATE``, so only the serialized parties
+and the results cross the process boundary.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, TypeVar
+
+# Parties per task sent to worker processes, and tasks kept in flight per worker.
+WORKER_CHUNK_SIZE = 200
+WORKER_TASKS_IN_FLIGHT = 2
+
+ChunkResultT = TypeVar("ChunkResultT")
+
+# Holds the loaded transformer's chunk method while transform_in_workers() runs.
+_WORKER_STATE: Dict[str, Callable[[List[bytes]], Any]] = {}
+
+
+def _transform_chunk(chunk: List[bytes]) -> Any:
+    """Worker entry point: transform serialized parties with the inherited transformer."""
+    transform_serialized = _WORKER_STATE.get("transform_serialized")
+    if transform_serialized is None:
+        raise RuntimeError("Worker process has no loaded transformer")
+    return transform_serialized(chunk)
+
+
+def transform_in_workers(
+    parties: Iterable[bytes], transform_serialized: Callable[[List[bytes]], ChunkResultT], workers: int
+) -> Iterator[ChunkResultT]:
+    """Farm chunks of serialized parties out to forked workers, yielding chunk results in document order."""
+    _WORKER_STATE["transform_serialized"] = transform_serialized
+    pending: Deque[Future] = deque()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            chunk: List[bytes] = []
+            for party_xml in parties:
+                chunk.append(party_xml)
+                if len(chunk) < WORKER_CHUNK_SIZE:
+                    continue
+                pending.append(executor.submit(_transform_chunk, chunk))
+                chunk = []
+                if len(pending) >= workers * WORKER_TASKS_IN_FLIGHT:
+                    yield pending.popleft().result()
+            if chunk:
+                pending.append(executor.submit(_transform_chunk, chunk))
+            while pending:
+                yield pending.popleft().result()
+    finally:
+        _WORKER_STATE.clear()
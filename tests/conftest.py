@@ -0,0 +1,43 @@
+"""Shared fixtures: the mapper module under each XML backend, and a runner over the sample feed."""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+SAMPLE_XML = Path(__file__).resolve().parent / "fixtures" / "sdn_advanced_sample.xml"
+
+
+@pytest.fixture(params=["lxml", "stdlib"])
+def mapper(request, monkeypatch):
+    """Import the mapper afresh, with lxml and with the stdlib ElementTree fallback."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    else:
+        monkeypatch.setitem(sys.modules, "lxml", None)
+    name = f"ofac_advanced_mapper_{request.param}"
+    spec = importlib.util.spec_from_file_location(name, SRC_DIR / "ofac_advanced_mapper.py")
+    module = importlib.util.module_from_spec(spec)
+    # Registered so forked workers can resolve pickled references to the module's functions.
+    monkeypatch.setitem(sys.modules, name, module)
+    spec.loader.exec_module(module)
+    assert module.LXML_AVAILABLE is (request.param == "lxml")
+    return module
+
+
+@pytest.fixture
+def run_sample(mapper, tmp_path):
+    """Return a callable transforming the sample feed, giving ``(stats, records, raw_jsonl)``."""
+
+    def run(workers: int = 1):
+        output = tmp_path / f"out_{workers}.jsonl"
+        transformer = mapper.StrictOFACTransformer()
+        transformer.load(SAMPLE_XML)
+        stats = transformer.transform(output_jsonl=output, workers=workers)
+        raw = output.read_bytes()
+        return stats, [json.loads(line) for line in raw.splitlines()], raw
+
+    return run
@@ -0,0 +1,28 @@
+"""Features whose data sits in a later FeatureVersion than the first."""
+
+
+def _features(records, record_id):
+    return next(record["FEATURES"] for record in records if record["RECORD_ID"] == record_id)
+
+
+def test_date_part_in_second_version(run_sample):
+    _, records, _ = run_sample()
+    assert {"DATE_OF_BIRTH": "1970-03-07"} in _features(records, "1001")
+
+
+def test_version_detail_falls_through_to_second_version(run_sample):
+    _, records, _ = run_sample()
+    features = _features(records, "1001")
+    assert {"EMAIL_ADDRESS": "ivan.petrov@example.com"} in features
+    assert {"GENDER": "Male"} in features
+
+
+def test_location_parts_and_version_location_across_versions(run_sample):
+    _, records, _ = run_sample()
+    assert {"ADDR_FULL": "Street 1, Moscow"} in _features(records, "1001")
+
+
+def test_reliability_comes_from_first_version(run_sample):
+    _, records, _ = run_sample()
+    person = next(record for record in records if record["RECORD_ID"] == "1001")
+    assert person["DATA_QUALITY_SCORE"] == 1
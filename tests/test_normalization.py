@@ -0,0 +1,92 @@
+"""Free-text date normalization and identifier-name sanitizing."""
+
+import pytest
+
+
+@pytest.fixture
+def normalize_date(mapper):
+    return getattr(mapper.StrictOFACTransformer, "_normalize_date_string")
+
+
+@pytest.fixture
+def sanitize_identifier(mapper):
+    return getattr(mapper, "_sanitize_identifier_name")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1970-03-07", "1970-03-07"),
+        ("1970-3-7", "1970-03-07"),
+        ("7 Mar 1970", "1970-03-07"),
+        ("07 March 1970", "1970-03-07"),
+        ("7  Mar 1970", "1970-03-07"),
+        ("1970/3/7", "1970-03-07"),
+        ("3/7/1970", "1970-03-07"),
+        ("03/07/1970", "1970-03-07"),
+        ("1970.03.07", "1970-03-07"),
+        ("  1970-03-07  ", "1970-03-07"),
+        ("\t7 Mar 1970\n", "1970-03-07"),
+    ],
+)
+def test_prefix_gated_formats(normalize_date, value, expected):
+    assert normalize_date(value) == expected
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1970", "1970"), (" 1970 ", "1970"), ("19700", None)])
+def test_bare_year(normalize_date, value, expected):
+    assert normalize_date(value) == expected
+
+
+@pytest.mark.parametrize("value", ["31 Feb 1970", "02/30/1970", "1970.02.30", "Mar 1970", "abc", "", "  "])
+def test_unparseable_dates(normalize_date, value):
+    assert normalize_date(value) is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        # strptime rejects these, so the leading YYYY-MM[-DD] is taken as is.
+        ("1970-02-30", "1970-02-30"),
+        ("1970-13-01", "1970-13-01"),
+        ("1970-03-07T00:00:00", "1970-03-07"),
+        ("1970-03-07 extra", "1970-03-07"),
+        ("1970-03", "1970-03"),
+        ("1970-03-xx", "1970-03"),
+        ("1970-3", None),
+    ],
+)
+def test_iso_prefix_fallback(normalize_date, value, expected):
+    assert normalize_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Passport", "PASSPORT"),
+        ("Tax ID No.", "TAX_ID_NO"),
+        ("R.F.C.", "R_F_C"),
+        ("  leading--and__trailing  ", "LEADING_AND_TRAILING"),
+        ("!!!", "!!!"),
+        ("", "UNKNOWN"),
+        (None, "UNKNOWN"),
+    ],
+)
+def test_sanitize_ascii_names(sanitize_identifier, name, expected):
+    assert sanitize_identifier(name) == expected
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Cédula de Identidad", "C_DULA_DE_IDENTIDAD"),
+        ("Identificação", "IDENTIFICA_O"),
+        ("N° 5", "N_5"),
+        # Upper-casing turns these ASCII, so they take the str.translate path.
+        ("straße", "STRASSE"),
+        ("ﬁle", "FILE"),
+        ("Ελληνικά", "Ελληνικά"),
+    ],
+)
+def test_sanitize_non_ascii_names(sanitize_identifier, name, expected):
+    assert sanitize_identifier(name) == expected
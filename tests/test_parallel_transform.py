@@ -0,0 +1,22 @@
+"""transform(workers=N) must write exactly what a single-process run writes."""
+
+import multiprocessing
+
+import pytest
+
+import parallel_transform
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="parallel transform needs the fork start method"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 200])
+def test_workers_match_single_process(run_sample, monkeypatch, chunk_size):
+    # A chunk size of 1 sends every party to its own task, exercising result ordering across tasks.
+    monkeypatch.setattr(parallel_transform, "WORKER_CHUNK_SIZE", chunk_size)
+    single_stats, _, single_jsonl = run_sample(workers=1)
+    parallel_stats, _, parallel_jsonl = run_sample(workers=2)
+    assert parallel_jsonl == single_jsonl
+    assert parallel_stats == single_stats
+    assert single_stats["emitted"] == 3